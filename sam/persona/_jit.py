@@ -0,0 +1,29 @@
+"""
+Optional Numba JIT support for numeric kernels.
+
+Numba is an optional dependency (``pip install sam-persona[jit]``). Without
+it, ``njit`` returns functions unchanged and ``prange`` is ``range``, so the
+kernels run as plain Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Return the decorated function unchanged when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
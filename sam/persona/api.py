@@ -69,6 +69,14 @@ class ObservabilitySummaryResponse(BaseModel):
     summary: Dict[str, Any]
 
 
+class HealthResponse(BaseModel):
+    """Response model for the service health check."""
+    status: str
+    service: str
+    version: str
+    personality: Dict[str, Any]
+
+
 def create_api_router(pmx: PersonalityMatrix) -> APIRouter:
     """
     Create the FastAPI router for Personality Matrix endpoints.
@@ -6,10 +6,13 @@ appropriateness filters, and context-aware boundary adjustments.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import (
     AudienceContext,
+    AudienceType,
     BoundaryCaps,
     ChannelContext,
     PersonalityConfig,
@@ -18,6 +21,40 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# A compiled boundary rule: (max_flirtation, max_humor, max_candor,
+# min_formality) caps and the safety tags it adds. Caps a rule leaves alone
+# are neutral (1.0 for maximums, 0.0 for the minimum).
+BoundaryRule = Tuple[Tuple[float, float, float, float], Tuple[str, ...]]
+
+# Context rules by the context key that triggers them. The flags trigger
+# their rule when set; the emotional state rule triggers for the sensitive
+# emotions.
+_CONTEXT_RULES: Dict[str, BoundaryRule] = {
+    "children_present": ((0.0, 0.8, 0.3, 0.5), ("child_safe",)),
+    "work_context": ((0.1, 0.6, 0.7, 0.6), ("work_appropriate",)),
+    "sensitive_topics": ((1.0, 1.0, 0.5, 0.6), ("sensitive_content",)),
+    "emotional_state": ((1.0, 0.5, 0.6, 0.0), ("emotionally_sensitive",)),
+}
+_CONTEXT_FLAGS = ("children_present", "work_context", "sensitive_topics")
+_SENSITIVE_EMOTIONS = frozenset(("vulnerable", "sad", "angry"))
+
+
+def _time_rule_for_hour(hour: int) -> str:
+    """Get the time rule for an hour of the day."""
+    if 9 <= hour <= 17:  # Business hours
+        return "business_hours"
+    elif 18 <= hour <= 22:  # After hours
+        return "after_hours"
+    else:  # Late night
+        return "late_night"
+
+
+# Time rule by local hour of the day
+_TIME_RULE_BY_HOUR = tuple(_time_rule_for_hour(hour) for hour in range(24))
+
+# Memoized boundary adjustments per manager
+BOUNDARY_CACHE_SIZE = 1024
+
 
 class BoundaryManager:
     """
@@ -40,6 +77,20 @@ class BoundaryManager:
         self._boundary_rules = self._initialize_boundary_rules()
         self._safety_patterns = self._initialize_safety_patterns()
         
+        # Rules compiled into direct lookups by audience type, channel kind
+        # and time period
+        self._audience_rules = {
+            AudienceType(audience_type): rule
+            for audience_type, rule in self._compile_rules(
+                self._boundary_rules["audience_rules"]
+            ).items()
+        }
+        self._channel_rules = self._compile_rules(self._boundary_rules["channel_rules"])
+        self._time_rules = self._compile_rules(self._boundary_rules["time_rules"])
+        
+        # Adjustments are pure functions of hashable keys, so they are memoized
+        self._adjusted_boundaries = lru_cache(maxsize=BOUNDARY_CACHE_SIZE)(self._adjust)
+        
         logger.info("Boundary Manager initialized")
     
     def _initialize_boundary_rules(self) -> Dict[str, Dict[str, Any]]:
@@ -137,6 +188,21 @@ class BoundaryManager:
             },
         }
     
+    def _compile_rules(self, rules: Dict[str, Dict[str, Any]]) -> Dict[str, BoundaryRule]:
+        """Compile a section of boundary rules into (caps, safety tags) pairs."""
+        return {
+            name: (
+                (
+                    rule.get("max_flirtation", 1.0),
+                    rule.get("max_humor", 1.0),
+                    rule.get("max_candor", 1.0),
+                    rule.get("min_formality", 0.0),
+                ),
+                tuple(rule.get("safety_tags", ())),
+            )
+            for name, rule in rules.items()
+        }
+    
     def _initialize_safety_patterns(self) -> Dict[str, List[str]]:
         """Initialize safety patterns for content filtering."""
         return {
@@ -182,166 +248,117 @@ class BoundaryManager:
                     audience.type.value if audience else "None",
                     channel.type.value if channel else "None")
         
+        # Adjustments only depend on these keys, so equal keys are memoized
+        (max_flirtation, max_humor, max_candor, min_formality), safety_tags = (
+            self._adjusted_boundaries(
+                current_boundaries.max_flirtation,
+                current_boundaries.max_humor,
+                current_boundaries.max_candor,
+                current_boundaries.min_formality,
+                tuple(current_boundaries.safety_tags),
+                audience.type if audience else None,
+                self._channel_rule_name(channel) if channel else None,
+                self._context_rule_names(context) if context else (),
+                self._time_rule_name(),
+            )
+        )
+        adjusted = BoundaryCaps(
+            max_flirtation=max_flirtation,
+            max_humor=max_humor,
+            max_candor=max_candor,
+            min_formality=min_formality,
+            safety_tags=list(safety_tags),
+        )
+        
+        logger.debug("Boundaries adjusted: flirtation=%.2f, humor=%.2f, candor=%.2f",
+                    adjusted.max_flirtation, adjusted.max_humor, adjusted.max_candor)
+        
+        return adjusted
+    
+    def _adjust(
+        self,
+        max_flirtation: float,
+        max_humor: float,
+        max_candor: float,
+        min_formality: float,
+        safety_tags: Tuple[str, ...],
+        audience_type: Optional[AudienceType],
+        channel_rule: Optional[str],
+        context_rules: Tuple[str, ...],
+        time_rule: str
+    ) -> BoundaryRule:
+        """Apply the audience, channel, context and time rules to boundary caps."""
         # Start with current boundaries
         adjusted = BoundaryCaps(
-            max_flirtation=current_boundaries.max_flirtation,
-            max_humor=current_boundaries.max_humor,
-            max_candor=current_boundaries.max_candor,
-            min_formality=current_boundaries.min_formality,
-            safety_tags=current_boundaries.safety_tags.copy(),
+            max_flirtation=max_flirtation,
+            max_humor=max_humor,
+            max_candor=max_candor,
+            min_formality=min_formality,
+            safety_tags=list(safety_tags),
         )
         
         # Apply audience-based adjustments
-        if audience:
-            adjusted = self._apply_audience_boundaries(adjusted, audience)
+        rule = self._audience_rules.get(audience_type)
+        if rule:
+            self._apply_rule(adjusted, rule)
         
         # Apply channel-based adjustments
-        if channel:
-            adjusted = self._apply_channel_boundaries(adjusted, channel)
+        if channel_rule:
+            self._apply_rule(adjusted, self._channel_rules[channel_rule])
         
         # Apply context-based adjustments
-        if context:
-            adjusted = self._apply_context_boundaries(adjusted, context)
+        for name in context_rules:
+            self._apply_rule(adjusted, _CONTEXT_RULES[name])
         
         # Apply time-based adjustments
-        adjusted = self._apply_time_boundaries(adjusted)
+        self._apply_rule(adjusted, self._time_rules[time_rule])
         
         # Ensure boundaries are within valid ranges
         adjusted = self._clamp_boundaries(adjusted)
         
-        logger.debug("Boundaries adjusted: flirtation=%.2f, humor=%.2f, candor=%.2f",
-                    adjusted.max_flirtation, adjusted.max_humor, adjusted.max_candor)
-        
-        return adjusted
-    
-    def _apply_audience_boundaries(
-        self,
-        boundaries: BoundaryCaps,
-        audience: AudienceContext
-    ) -> BoundaryCaps:
-        """Apply audience-specific boundary adjustments."""
-        audience_rules = self._boundary_rules["audience_rules"]
-        audience_type = audience.type.value
-        
-        if audience_type in audience_rules:
-            rules = audience_rules[audience_type]
-            
-            # Apply boundary caps
-            boundaries.max_flirtation = min(boundaries.max_flirtation, rules["max_flirtation"])
-            boundaries.max_humor = min(boundaries.max_humor, rules["max_humor"])
-            boundaries.max_candor = min(boundaries.max_candor, rules["max_candor"])
-            boundaries.min_formality = max(boundaries.min_formality, rules["min_formality"])
-            
-            # Add safety tags
-            for tag in rules["safety_tags"]:
-                if tag not in boundaries.safety_tags:
-                    boundaries.safety_tags.append(tag)
-        
-        return boundaries
+        return (
+            (adjusted.max_flirtation, adjusted.max_humor, adjusted.max_candor, adjusted.min_formality),
+            tuple(adjusted.safety_tags),
+        )
     
-    def _apply_channel_boundaries(
-        self,
-        boundaries: BoundaryCaps,
-        channel: ChannelContext
-    ) -> BoundaryCaps:
-        """Apply channel-specific boundary adjustments."""
-        channel_rules = self._boundary_rules["channel_rules"]
-        
-        # Determine channel type
+    def _channel_rule_name(self, channel: ChannelContext) -> str:
+        """Get the channel rule that applies to a channel."""
         if not channel.is_private:
-            channel_type = "public"
+            return "public"
         elif "work" in channel.platform.lower() if channel.platform else False:
-            channel_type = "work"
+            return "work"
         else:
-            channel_type = "private"
-        
-        if channel_type in channel_rules:
-            rules = channel_rules[channel_type]
-            
-            # Apply boundary caps
-            boundaries.max_flirtation = min(boundaries.max_flirtation, rules["max_flirtation"])
-            boundaries.max_humor = min(boundaries.max_humor, rules["max_humor"])
-            boundaries.max_candor = min(boundaries.max_candor, rules["max_candor"])
-            boundaries.min_formality = max(boundaries.min_formality, rules["min_formality"])
-            
-            # Add safety tags
-            for tag in rules["safety_tags"]:
-                if tag not in boundaries.safety_tags:
-                    boundaries.safety_tags.append(tag)
-        
-        return boundaries
+            return "private"
     
-    def _apply_context_boundaries(
-        self,
-        boundaries: BoundaryCaps,
-        context: Dict[str, Any]
-    ) -> BoundaryCaps:
-        """Apply context-based boundary adjustments."""
-        # Check for presence of children
-        if context.get("children_present", False):
-            boundaries.max_flirtation = min(boundaries.max_flirtation, 0.0)
-            boundaries.max_humor = min(boundaries.max_humor, 0.8)
-            boundaries.max_candor = min(boundaries.max_candor, 0.3)
-            boundaries.min_formality = max(boundaries.min_formality, 0.5)
-            
-            if "child_safe" not in boundaries.safety_tags:
-                boundaries.safety_tags.append("child_safe")
-        
-        # Check for work context
-        if context.get("work_context", False):
-            boundaries.max_flirtation = min(boundaries.max_flirtation, 0.1)
-            boundaries.max_humor = min(boundaries.max_humor, 0.6)
-            boundaries.max_candor = min(boundaries.max_candor, 0.7)
-            boundaries.min_formality = max(boundaries.min_formality, 0.6)
-            
-            if "work_appropriate" not in boundaries.safety_tags:
-                boundaries.safety_tags.append("work_appropriate")
-        
-        # Check for sensitive topics
-        sensitive_topics = context.get("sensitive_topics", [])
-        if sensitive_topics:
-            boundaries.max_candor = min(boundaries.max_candor, 0.5)
-            boundaries.min_formality = max(boundaries.min_formality, 0.6)
-            
-            if "sensitive_content" not in boundaries.safety_tags:
-                boundaries.safety_tags.append("sensitive_content")
-        
-        # Check for emotional state
+    def _context_rule_names(self, context: Dict[str, Any]) -> Tuple[str, ...]:
+        """Get the context rules triggered by a context, in application order."""
+        # Children present, work context and sensitive topics each trigger
+        # their rule when set
+        names = tuple(flag for flag in _CONTEXT_FLAGS if context.get(flag))
+        
+        # Check for emotional state; context is free-form, so only strings
+        # can name an emotion
         emotional_state = context.get("emotional_state", "neutral")
-        if emotional_state in ["vulnerable", "sad", "angry"]:
-            boundaries.max_humor = min(boundaries.max_humor, 0.5)
-            boundaries.max_candor = min(boundaries.max_candor, 0.6)
-            
-            if "emotionally_sensitive" not in boundaries.safety_tags:
-                boundaries.safety_tags.append("emotionally_sensitive")
+        if isinstance(emotional_state, str) and emotional_state in _SENSITIVE_EMOTIONS:
+            names += ("emotional_state",)
         
-        return boundaries
+        return names
     
-    def _apply_time_boundaries(self, boundaries: BoundaryCaps) -> BoundaryCaps:
-        """Apply time-based boundary adjustments."""
-        from datetime import datetime
-        
-        now = datetime.now()
-        hour = now.hour
-        
-        # Determine time period
-        if 9 <= hour <= 17:  # Business hours
-            time_type = "business_hours"
-        elif 18 <= hour <= 22:  # After hours
-            time_type = "after_hours"
-        else:  # Late night
-            time_type = "late_night"
-        
-        time_rules = self._boundary_rules["time_rules"]
-        if time_type in time_rules:
-            rules = time_rules[time_type]
-            
-            # Apply boundary caps
-            boundaries.max_flirtation = min(boundaries.max_flirtation, rules["max_flirtation"])
-            boundaries.max_humor = min(boundaries.max_humor, rules["max_humor"])
-            boundaries.min_formality = max(boundaries.min_formality, rules["min_formality"])
-        
-        return boundaries
+    def _time_rule_name(self) -> str:
+        """Get the time rule for the current local time."""
+        return _TIME_RULE_BY_HOUR[time.localtime().tm_hour]
+    
+    def _apply_rule(self, boundaries: BoundaryCaps, rule: BoundaryRule) -> None:
+        """Apply a compiled rule's caps and safety tags to boundaries in place."""
+        (max_flirtation, max_humor, max_candor, min_formality), safety_tags = rule
+        boundaries.max_flirtation = min(boundaries.max_flirtation, max_flirtation)
+        boundaries.max_humor = min(boundaries.max_humor, max_humor)
+        boundaries.max_candor = min(boundaries.max_candor, max_candor)
+        boundaries.min_formality = max(boundaries.min_formality, min_formality)
+        
+        for tag in safety_tags:
+            if tag not in boundaries.safety_tags:
+                boundaries.safety_tags.append(tag)
     
     def _clamp_boundaries(self, boundaries: BoundaryCaps) -> BoundaryCaps:
         """Ensure boundary values are within valid ranges."""
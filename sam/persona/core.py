@@ -9,8 +9,9 @@ and boundary management.
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 from uuid import uuid4
 
 import numpy as np
@@ -38,6 +39,13 @@ from .observability import ObservabilityManager
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of states and style profiles kept in history
+MAX_HISTORY = 10_000
+
+# Combined valence, arousal and fatigue change from the state the current style
+# was synthesized for, below which the style is not resynthesized
+NOOP_STATE_EPSILON = 1e-4
+
 
 class PersonalityMatrix:
     """
@@ -74,9 +82,17 @@ class PersonalityMatrix:
         self._current_style: Optional[StyleProfile] = None
         self._current_boundaries: Optional[BoundaryCaps] = None
         
+        # State and audience and channel types the current style was
+        # synthesized for
+        self._style_state: Optional[AffectiveState] = None
+        self._style_context: Optional[Tuple[Any, Any]] = None
+        
         # History and traces
-        self._style_history: List[StyleTrace] = []
-        self._state_history: List[AffectiveState] = []
+        self._style_history: Deque[StyleProfile] = deque(maxlen=MAX_HISTORY)
+        self._state_history: Deque[AffectiveState] = deque(maxlen=MAX_HISTORY)
+        
+        # Personality summary, cleared whenever the current state changes
+        self._cached_summary: Optional[Dict[str, Any]] = None
         
         # Initialize to baseline
         self._initialize_baseline()
@@ -101,9 +117,12 @@ class PersonalityMatrix:
             audience=None,
             channel=None
         )
+        self._style_state = self._current_state
+        self._style_context = (None, None)
         
         # Set baseline boundaries
         self._current_boundaries = self.config.default_boundaries
+        self._cached_summary = None
         
         logger.info("Baseline state initialized")
     
@@ -144,23 +163,104 @@ class PersonalityMatrix:
         Returns:
             Updated style profile
         """
-        logger.info("Processing state update: %s (intensity: %.2f)", 
-                   update.event_type, update.intensity)
+        return self.update_state_many_sync([update])
+    
+    def update_state_sync(self, update: StateUpdate) -> StyleProfile:
+        """
+        Update the affective state based on an event without awaiting.
         
-        # Update affective state
-        new_state = self.state_engine.update_state(
-            current_state=self.get_current_state(),
-            update=update
-        )
+        The update pipeline does no I/O, so callers outside an event loop
+        can use this directly.
         
-        # Apply boundary adjustments based on context
-        boundaries = self.boundary_manager.adjust_boundaries(
-            current_boundaries=self.get_boundary_caps(),
-            audience=update.audience,
-            channel=update.channel,
-            context=update.context
+        Args:
+            update: State update containing event information
+            
+        Returns:
+            Updated style profile
+        """
+        return self.update_state_many_sync([update])
+    
+    async def update_state_many(self, updates: Sequence[StateUpdate]) -> StyleProfile:
+        """
+        Update the affective state based on several events at once.
+        
+        Each event updates the state and boundaries in turn, exactly as
+        consecutive update_state calls would. The style is then synthesized,
+        drift-checked, traced and lensed once, for the final state and the
+        last event's context. Events that leave the state, boundaries and
+        context effectively unchanged still update the state, but the current
+        style is kept and no trace is recorded.
+        
+        Args:
+            updates: State updates in the order they occurred
+            
+        Returns:
+            Updated style profile
+        """
+        return self.update_state_many_sync(updates)
+    
+    def update_state_many_sync(self, updates: Sequence[StateUpdate]) -> StyleProfile:
+        """
+        Update the affective state based on several events at once, without
+        awaiting.
+        
+        Args:
+            updates: State updates in the order they occurred
+            
+        Returns:
+            Updated style profile
+        """
+        if not updates:
+            return self.get_style_profile()
+        
+        new_state = self.get_current_state()
+        start_boundaries = boundaries = self.get_boundary_caps()
+        states = []
+        for update in updates:
+            logger.info("Processing state update: %s (intensity: %.2f)", 
+                       update.event_type, update.intensity)
+            
+            # Update affective state
+            new_state = self.state_engine.update_state(
+                current_state=new_state,
+                update=update
+            )
+            states.append(new_state)
+            
+            # Apply boundary adjustments based on context
+            boundaries = self.boundary_manager.adjust_boundaries(
+                current_boundaries=boundaries,
+                audience=update.audience,
+                channel=update.channel,
+                context=update.context
+            )
+        
+        update = updates[-1]
+        style_context = (
+            update.audience.type if update.audience else None,
+            update.channel.type if update.channel else None,
         )
         
+        self._state_history.extend(states)
+        self._cached_summary = None
+        
+        # While the state stays within epsilon of the state the current style
+        # was synthesized for, and boundaries and context are unchanged, keep
+        # the current style without synthesis or tracing
+        style_state = self._style_state
+        if (
+            style_state is not None
+            and style_context == self._style_context
+            and boundaries == start_boundaries
+            and abs(new_state.valence - style_state.valence)
+            + abs(new_state.arousal - style_state.arousal)
+            + abs(new_state.fatigue - style_state.fatigue) < NOOP_STATE_EPSILON
+        ):
+            logger.debug("State update left the style unchanged, keeping current style")
+            # The new state is still kept, so small changes accumulate
+            self._current_state = new_state
+            return self.get_style_profile()
+        
         # Synthesize new style profile
         new_style = self.style_synthesizer.synthesize_style(
             traits=self.traits,
@@ -176,13 +276,15 @@ class PersonalityMatrix:
             logger.warning("Personality drift detected, applying corrections")
             new_style = self._apply_drift_corrections(new_style)
         
-        # Update current state
+        # Update current state only now, since drift corrections pull toward
+        # the style of the previous state
         self._current_state = new_state
         self._current_style = new_style
         self._current_boundaries = boundaries
+        self._style_state = new_state
+        self._style_context = style_context
         
         # Record in history
-        self._state_history.append(new_state)
         self._style_history.append(new_style)
         
         # Create and store trace
@@ -190,7 +292,7 @@ class PersonalityMatrix:
         self.observability.record_trace(trace)
         
         # Apply memory lensing
-        await self.memory_lenser.apply_lensing(
+        self.memory_lenser.apply_lensing_sync(
             state=new_state,
             style=new_style,
             context=update.context
@@ -274,8 +376,8 @@ class PersonalityMatrix:
             inputs={
                 "event_type": update.event_type,
                 "intensity": update.intensity,
-                "audience": update.audience.dict() if update.audience else None,
-                "channel": update.channel.dict() if update.channel else None,
+                "audience": update.audience.model_dump() if update.audience else None,
+                "channel": update.channel.model_dump() if update.channel else None,
             },
             state=state,
             style_delta=style_delta,
@@ -325,9 +427,10 @@ class PersonalityMatrix:
         
         self._initialize_baseline()
         
-        # Clear recent history
-        self._style_history = self._style_history[-10:]  # Keep last 10
-        self._state_history = self._state_history[-10:]
+        # Clear recent history, keeping the last 10 entries
+        for history in (self._style_history, self._state_history):
+            while len(history) > 10:
+                history.popleft()
         
         return self.get_style_profile()
     
@@ -344,11 +447,11 @@ class PersonalityMatrix:
     def export_personality(self) -> Dict[str, Any]:
         """Export the current personality state for persistence."""
         return {
-            "traits": self.traits.dict(),
-            "current_state": self.get_current_state().dict(),
-            "current_style": self.get_style_profile().dict(),
-            "current_boundaries": self.get_boundary_caps().dict(),
-            "config": self.config.dict(),
+            "traits": self.traits.model_dump(),
+            "current_state": self.get_current_state().model_dump(),
+            "current_style": self.get_style_profile().model_dump(),
+            "current_boundaries": self.get_boundary_caps().model_dump(),
+            "config": self.config.model_dump(),
             "export_timestamp": datetime.utcnow().isoformat(),
         }
     
@@ -357,24 +460,27 @@ class PersonalityMatrix:
         try:
             # Import traits (immutable, so validate only)
             traits_data = data.get("traits", {})
-            imported_traits = TraitKernel(**traits_data)
+            imported_traits = TraitKernel.model_validate(traits_data)
             
             # Import current state
             state_data = data.get("current_state", {})
-            imported_state = AffectiveState(**state_data)
+            imported_state = AffectiveState.model_validate(state_data)
             
             # Import current style
             style_data = data.get("current_style", {})
-            imported_style = StyleProfile(**style_data)
+            imported_style = StyleProfile.model_validate(style_data)
             
             # Import current boundaries
             boundaries_data = data.get("current_boundaries", {})
-            imported_boundaries = BoundaryCaps(**boundaries_data)
+            imported_boundaries = BoundaryCaps.model_validate(boundaries_data)
             
             # Update current state
             self._current_state = imported_state
             self._current_style = imported_style
             self._current_boundaries = imported_boundaries
+            self._style_state = None
+            self._style_context = None
+            self._cached_summary = None
             
             logger.info("Personality state imported successfully")
             
@@ -396,7 +502,24 @@ class PersonalityMatrix:
         )
     
     def get_personality_summary(self) -> Dict[str, Any]:
-        """Get a summary of the current personality state."""
+        """
+        Get a summary of the current personality state.
+        
+        The summary is rebuilt only after the state, style or boundaries
+        change. Each call returns a copy, so callers may modify it.
+        """
+        if self._cached_summary is None:
+            self._cached_summary = self._build_personality_summary()
+        return {
+            name: {
+                key: list(value) if isinstance(value, list) else value
+                for key, value in section.items()
+            }
+            for name, section in self._cached_summary.items()
+        }
+    
+    def _build_personality_summary(self) -> Dict[str, Any]:
+        """Build the personality summary from the current state."""
         state = self.get_current_state()
         style = self.get_style_profile()
         
@@ -412,7 +535,7 @@ class PersonalityMatrix:
                 "valence": state.valence,
                 "arousal": state.arousal,
                 "fatigue": state.fatigue,
-                "tags": state.tags,
+                "tags": list(state.tags),
             },
             "communication_style": {
                 "warmth": style.tone.warmth,
@@ -423,7 +546,7 @@ class PersonalityMatrix:
             "boundaries": {
                 "max_flirtation": self.get_boundary_caps().max_flirtation,
                 "max_humor": self.get_boundary_caps().max_humor,
-                "safety_tags": self.get_boundary_caps().safety_tags,
+                "safety_tags": list(self.get_boundary_caps().safety_tags),
             },
             "llm_settings": {
                 "temperature": style.decoding.temp,
@@ -124,6 +124,25 @@ class MemoryLenser:
         """
         Apply affective lensing to current context.
         
+        Args:
+            state: Current affective state
+            style: Current style profile
+            context: Context information
+            
+        Returns:
+            Affective lens tags with weights
+        """
+        return self.apply_lensing_sync(state, style, context)
+    
+    def apply_lensing_sync(
+        self,
+        state: AffectiveState,
+        style: StyleProfile,
+        context: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """
+        Apply affective lensing to current context without awaiting.
+        
         Args:
             state: Current affective state
             style: Current style profile
@@ -325,7 +344,7 @@ class MemoryLenser:
         
         # Emotional context
         emotional_state = context.get("emotional_state", "neutral")
-        if emotional_state != "neutral":
+        if isinstance(emotional_state, str) and emotional_state != "neutral":
             adjusted[emotional_state] = 0.8
             adjusted["emotional"] = 0.7
         
@@ -221,6 +221,7 @@ class PersonalityConfig(BaseModel):
     # Style settings
     style_adaptation_rate: float = Field(default=0.3, ge=0.0, le=1.0)
     drift_threshold: float = Field(default=0.2, ge=0.0, le=1.0)
+    enable_style_cache: bool = Field(default=False)
     
     # Decoding settings
     decoding_ranges: Dict[str, Dict[str, Union[float, int]]] = Field(
@@ -236,4 +237,13 @@ class PersonalityConfig(BaseModel):
     
     # Observability settings
     trace_retention_days: int = Field(default=30, ge=1)
+    full_trace_retention: int = Field(
+        default=1000,
+        ge=1,
+        description=(
+            "Minimum number of newest traces kept in full; older traces are "
+            "compacted hourly to timestamps and style deltas, and are no longer "
+            "returned by trace queries or exports"
+        ),
+    )
     enable_drift_alerts: bool = Field(default=True)
\ No newline at end of file
@@ -5,20 +5,78 @@ This module handles tracing, monitoring, and observability features
 for the personality matrix system.
 """
 
-import json
+import copy
 import logging
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+import numpy as np
+import orjson
+
 from .models import (
     PersonalityConfig,
     StyleTrace,
 )
+from .trace_compression import (
+    MS_PER_HOUR,
+    STYLE_DIMENSIONS,
+    TraceChunk,
+    compress_by_hour,
+    parse_delta,
+    to_epoch_ms,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of drift alerts kept in memory
+MAX_DRIFT_ALERTS = 10_000
+
+# Window used for drift alert health counters
+DRIFT_WINDOW_HOURS = 24
+
+NS_PER_HOUR = 3_600 * 1_000_000_000
+
+# Retention windows for metric entries
+METRIC_RETENTION_NS = 7 * 24 * NS_PER_HOUR
+PERFORMANCE_RETENTION_NS = 24 * NS_PER_HOUR
+
+# Seconds a computed observability summary is reused
+SUMMARY_CACHE_TTL = 1.0
+
+# Interned tag tuples shared between metric entries
+_TAG_CACHE: Dict[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]] = {}
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for objects orjson does not serialize natively."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def _intern_tags(tags: Optional[Dict[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    """Convert metric tags to a sorted tuple of pairs shared across entries."""
+    if not tags:
+        return ()
+    key = tuple(sorted(tags.items()))
+    return _TAG_CACHE.setdefault(key, key)
+
+
+class MetricEntry:
+    """Single metric sample with a nanosecond timestamp and interned tags."""
+    
+    __slots__ = ("ts_ns", "value", "tags")
+    
+    def __init__(self, ts_ns: int, value: float, tags: Tuple[Tuple[str, str], ...] = ()):
+        self.ts_ns = ts_ns
+        self.value = value
+        self.tags = tags
+
 
 class ObservabilityManager:
     """
@@ -26,6 +84,15 @@ class ObservabilityManager:
     
     This class handles style traces, drift detection, performance monitoring,
     and observability features for debugging and analysis.
+    
+    The most recent traces (at least ``config.full_trace_retention``) are kept
+    in full. Older traces are rolled hourly into compressed chunks that only
+    feed the style evolution analytics.
+    
+    The manager is owned by the service's single event loop. Its methods
+    never await, so each update runs to completion without interleaving
+    and no locking is needed. Running several worker processes gives each
+    one its own manager.
     """
     
     def __init__(self, config: PersonalityConfig):
@@ -37,17 +104,26 @@ class ObservabilityManager:
         """
         self.config = config
         
-        # Storage for traces and metrics
-        self._traces: List[StyleTrace] = []
-        self._metrics: Dict[str, List[Dict[str, Any]]] = {}
-        self._drift_alerts: List[Dict[str, Any]] = []
-        
-        # Performance tracking
-        self._performance_metrics = {
-            "style_synthesis_time": [],
-            "state_update_time": [],
-            "boundary_adjustment_time": [],
-            "memory_lensing_time": [],
+        # Storage for traces and metrics (traces are appended in time order)
+        self._traces: Deque[StyleTrace] = deque()
+        self._trace_chunks: Deque[TraceChunk] = deque()
+        self._last_compaction_hour: Optional[int] = None
+        self._metrics: Dict[str, Deque[MetricEntry]] = {}
+        self._drift_alerts: Deque[Dict[str, Any]] = deque(maxlen=MAX_DRIFT_ALERTS)
+        
+        # Hourly [hour, total, high severity] drift alert counters
+        self._drift_buckets: Deque[List[int]] = deque()
+        
+        # Cached observability summary and its expiry (monotonic seconds)
+        self._cached_summary: Optional[Dict[str, Any]] = None
+        self._cached_summary_expires = 0.0
+        
+        # Performance tracking (entries are appended in time order)
+        self._performance_metrics: Dict[str, Deque[MetricEntry]] = {
+            "style_synthesis_time": deque(),
+            "state_update_time": deque(),
+            "boundary_adjustment_time": deque(),
+            "memory_lensing_time": deque(),
         }
         
         logger.info("Observability Manager initialized")
@@ -64,6 +140,7 @@ class ObservabilityManager:
         
         # Maintain trace retention policy
         self._cleanup_old_traces()
+        self._compact_traces()
         
         # Check for drift
         if self.config.enable_drift_alerts:
@@ -81,10 +158,8 @@ class ObservabilityManager:
         Returns:
             List of recent style traces
         """
-        # Sort by timestamp (newest first)
-        sorted_traces = sorted(self._traces, key=lambda t: t.ts, reverse=True)
-        
-        return sorted_traces[:limit]
+        # Traces are stored oldest first, so the newest are at the tail
+        return list(islice(reversed(self._traces), limit))
     
     def get_traces_by_time_range(
         self,
@@ -94,6 +169,10 @@ class ObservabilityManager:
         """
         Get traces within a specific time range.
         
+        Only traces held in full are searched. Older traces are compacted
+        into hourly chunks that keep just timestamps and style deltas; they
+        are counted in the observability summary but not returned here.
+        
         Args:
             start_time: Start of time range
             end_time: End of time range
@@ -110,6 +189,10 @@ class ObservabilityManager:
         """
         Get traces for a specific event type.
         
+        Only traces held in full are searched. Older traces are compacted
+        into hourly chunks that keep just timestamps and style deltas; they
+        are counted in the observability summary but not returned here.
+        
         Args:
             event_type: Event type to filter by
             
@@ -135,14 +218,10 @@ class ObservabilityManager:
             value: Metric value
             tags: Optional tags for the metric
         """
-        metric_entry = {
-            "timestamp": datetime.utcnow(),
-            "value": value,
-            "tags": tags or {},
-        }
+        metric_entry = MetricEntry(time.time_ns(), value, _intern_tags(tags))
         
         if metric_name not in self._metrics:
-            self._metrics[metric_name] = []
+            self._metrics[metric_name] = deque()
         
         self._metrics[metric_name].append(metric_entry)
         
@@ -164,17 +243,14 @@ class ObservabilityManager:
             duration: Duration in seconds
         """
         if operation in self._performance_metrics:
-            self._performance_metrics[operation].append({
-                "timestamp": datetime.utcnow(),
-                "duration": duration,
-            })
+            entries = self._performance_metrics[operation]
+            now_ns = time.time_ns()
+            entries.append(MetricEntry(now_ns, duration))
             
             # Keep only recent performance data
-            cutoff = datetime.utcnow() - timedelta(hours=24)
-            self._performance_metrics[operation] = [
-                entry for entry in self._performance_metrics[operation]
-                if entry["timestamp"] > cutoff
-            ]
+            cutoff_ns = now_ns - PERFORMANCE_RETENTION_NS
+            while entries and entries[0].ts_ns <= cutoff_ns:
+                entries.popleft()
     
     def get_performance_summary(self) -> Dict[str, Dict[str, float]]:
         """
@@ -187,13 +263,16 @@ class ObservabilityManager:
         
         for operation, entries in self._performance_metrics.items():
             if entries:
-                durations = [entry["duration"] for entry in entries]
+                durations = np.fromiter(
+                    (entry.value for entry in entries), dtype=np.float64, count=len(entries)
+                )
+                p95_index = int(durations.size * 0.95)
                 summary[operation] = {
-                    "count": len(durations),
-                    "avg_duration": sum(durations) / len(durations),
-                    "min_duration": min(durations),
-                    "max_duration": max(durations),
-                    "p95_duration": sorted(durations)[int(len(durations) * 0.95)],
+                    "count": int(durations.size),
+                    "avg_duration": float(durations.mean()),
+                    "min_duration": float(durations.min()),
+                    "max_duration": float(durations.max()),
+                    "p95_duration": float(np.partition(durations, p95_index)[p95_index]),
                 }
             else:
                 summary[operation] = {
@@ -220,62 +299,60 @@ class ObservabilityManager:
             Style evolution summary
         """
         cutoff = datetime.utcnow() - timedelta(hours=hours)
-        recent_traces = [
-            trace for trace in self._traces
-            if trace.ts > cutoff
-        ]
+        cutoff_ms = to_epoch_ms(cutoff)
         
-        if not recent_traces:
-            return {"message": "No recent traces available"}
+        total_traces = 0
+        total_changes = 0
+        change_types: Dict[str, List[np.ndarray]] = {}
+        
+        # Decode compressed chunks overlapping the window
+        for chunk in self._trace_chunks:
+            if chunk.end_ms <= cutoff_ms:
+                continue
+            in_window = chunk.timestamps_ms() > cutoff_ms
+            total_traces += int(np.count_nonzero(in_window))
+            total_changes += int(np.count_nonzero(in_window & chunk.changed_mask()))
+            for dimension in STYLE_DIMENSIONS:
+                values = chunk.decode_dimension(dimension)[in_window]
+                values = values[~np.isnan(values)]
+                if values.size:
+                    change_types.setdefault(dimension, []).append(values)
+        
+        # Add traces still held in full
+        for trace in self._traces:
+            if trace.ts <= cutoff:
+                continue
+            total_traces += 1
+            if not trace.style_delta:
+                continue
+            total_changes += 1
+            for dimension, delta in trace.style_delta.items():
+                value = parse_delta(delta)
+                if value is not None:
+                    change_types.setdefault(dimension, []).append(np.array([value]))
         
-        # Analyze style changes
-        style_changes = []
-        for trace in recent_traces:
-            if trace.style_delta:
-                style_changes.append(trace.style_delta)
+        if total_traces == 0:
+            return {"message": "No recent traces available"}
         
-        # Calculate statistics
-        total_changes = len(style_changes)
         if total_changes == 0:
             return {"message": "No style changes detected"}
         
-        # Analyze change patterns
-        change_types = {}
-        for change in style_changes:
-            for dimension, delta in change.items():
-                if dimension not in change_types:
-                    change_types[dimension] = []
-                change_types[dimension].append(delta)
-        
         # Calculate summary statistics
         summary = {
-            "total_traces": len(recent_traces),
+            "total_traces": total_traces,
             "total_style_changes": total_changes,
-            "change_frequency": total_changes / len(recent_traces),
+            "change_frequency": total_changes / total_traces,
             "dimension_changes": {},
         }
         
-        for dimension, deltas in change_types.items():
-            # Parse delta strings to get numeric values
-            numeric_deltas = []
-            for delta in deltas:
-                try:
-                    if delta.startswith("+"):
-                        numeric_deltas.append(float(delta[1:]))
-                    elif delta.startswith("-"):
-                        numeric_deltas.append(-float(delta[1:]))
-                    else:
-                        numeric_deltas.append(float(delta))
-                except ValueError:
-                    continue
-            
-            if numeric_deltas:
-                summary["dimension_changes"][dimension] = {
-                    "count": len(numeric_deltas),
-                    "avg_change": sum(numeric_deltas) / len(numeric_deltas),
-                    "max_increase": max(numeric_deltas) if numeric_deltas else 0.0,
-                    "max_decrease": min(numeric_deltas) if numeric_deltas else 0.0,
-                }
+        for dimension, parts in change_types.items():
+            numeric_deltas = np.concatenate(parts)
+            summary["dimension_changes"][dimension] = {
+                "count": int(numeric_deltas.size),
+                "avg_change": float(numeric_deltas.mean()),
+                "max_increase": float(numeric_deltas.max()),
+                "max_decrease": float(numeric_deltas.min()),
+            }
         
         return summary
     
@@ -289,7 +366,9 @@ class ObservabilityManager:
         Returns:
             List of drift alerts
         """
-        return self._drift_alerts[-limit:]
+        recent = list(islice(reversed(self._drift_alerts), limit))
+        recent.reverse()
+        return recent
     
     def export_traces(
         self,
@@ -299,6 +378,10 @@ class ObservabilityManager:
         """
         Export traces in the specified format.
         
+        Only traces held in full are exported. Older traces are compacted
+        into hourly chunks that keep just timestamps and style deltas, and
+        cannot be exported as traces.
+        
         Args:
             format: Export format ("json" or "csv")
             time_range: Optional (start_time, end_time) tuple
@@ -313,11 +396,15 @@ class ObservabilityManager:
             traces = self._traces
         
         if format.lower() == "json":
-            return json.dumps(
-                [trace.dict() for trace in traces],
-                indent=2,
-                default=str
-            )
+            return orjson.dumps(
+                list(traces),
+                default=_orjson_default,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NAIVE_UTC
+                ),
+            ).decode("utf-8")
         elif format.lower() == "csv":
             # Simple CSV export
             if not traces:
@@ -345,13 +432,28 @@ class ObservabilityManager:
         """
         Get a comprehensive observability summary.
         
+        The summary is recomputed at most once per SUMMARY_CACHE_TTL seconds;
+        callers get their own copy, so mutating it leaves the cache intact.
+        
         Returns:
             Observability summary
         """
+        now = time.monotonic()
+        if self._cached_summary is None or now >= self._cached_summary_expires:
+            self._cached_summary = self._build_observability_summary()
+            self._cached_summary_expires = now + SUMMARY_CACHE_TTL
+        
+        return copy.deepcopy(self._cached_summary)
+    
+    def _build_observability_summary(self) -> Dict[str, Any]:
+        """Compute the observability summary from the current data."""
+        compressed_count = self._compressed_trace_count()
+        
         return {
             "traces": {
-                "total_count": len(self._traces),
-                "recent_count": len(self.get_recent_traces(24)),
+                "total_count": len(self._traces) + compressed_count,
+                "compressed_count": compressed_count,
+                "recent_count": min(24, len(self._traces)),
                 "retention_days": self.config.trace_retention_days,
             },
             "metrics": {
@@ -361,7 +463,7 @@ class ObservabilityManager:
             "performance": self.get_performance_summary(),
             "drift_alerts": {
                 "total_count": len(self._drift_alerts),
-                "recent_count": len(self.get_drift_alerts(24)),
+                "recent_count": min(24, len(self._drift_alerts)),
             },
             "style_evolution": self.get_style_evolution_summary(24),
         }
@@ -369,23 +471,61 @@ class ObservabilityManager:
     def _cleanup_old_traces(self) -> None:
         """Remove traces older than the retention period."""
         cutoff = datetime.utcnow() - timedelta(days=self.config.trace_retention_days)
-        self._traces = [
-            trace for trace in self._traces
-            if trace.ts > cutoff
-        ]
+        
+        # Traces are appended in time order, so expired ones are at the head
+        while self._traces and self._traces[0].ts <= cutoff:
+            self._traces.popleft()
+        
+        # Chunks are dropped once their newest trace has expired
+        cutoff_ms = to_epoch_ms(cutoff)
+        while self._trace_chunks and self._trace_chunks[0].end_ms <= cutoff_ms:
+            self._trace_chunks.popleft()
+    
+    def _compact_traces(self) -> None:
+        """Roll whole hours of older traces into compressed chunks, once per hour."""
+        current_hour = to_epoch_ms(datetime.utcnow()) // MS_PER_HOUR
+        if current_hour == self._last_compaction_hour:
+            return
+        self._last_compaction_hour = current_hour
+        
+        # Flush only whole, completed hours and keep enough traces in full
+        limit = len(self._traces) - self.config.full_trace_retention
+        if limit <= 0:
+            return
+        
+        flush_until = 0
+        prev_hour = None
+        for i, trace in enumerate(islice(self._traces, limit + 1)):
+            hour = to_epoch_ms(trace.ts) // MS_PER_HOUR
+            if prev_hour is not None and hour != prev_hour:
+                flush_until = i
+            if hour >= current_hour:
+                break
+            prev_hour = hour
+        
+        if flush_until == 0:
+            return
+        
+        flushed = [self._traces.popleft() for _ in range(flush_until)]
+        self._trace_chunks.extend(compress_by_hour(flushed))
+        
+        logger.debug("Compressed %d traces into hourly chunks", flush_until)
+    
+    def _compressed_trace_count(self) -> int:
+        """Count traces held in compressed chunks."""
+        return sum(chunk.count for chunk in self._trace_chunks)
     
     def _cleanup_old_metrics(self) -> None:
         """Remove metrics older than 7 days."""
-        cutoff = datetime.utcnow() - timedelta(days=7)
+        cutoff_ns = time.time_ns() - METRIC_RETENTION_NS
         
-        for metric_name in list(self._metrics.keys()):
-            self._metrics[metric_name] = [
-                entry for entry in self._metrics[metric_name]
-                if entry["timestamp"] > cutoff
-            ]
+        # Entries are appended in time order, so expired ones are at the head
+        for metric_name, entries in list(self._metrics.items()):
+            while entries and entries[0].ts_ns <= cutoff_ns:
+                entries.popleft()
             
             # Remove empty metric lists
-            if not self._metrics[metric_name]:
+            if not entries:
                 del self._metrics[metric_name]
     
     def _check_for_drift(self, trace: StyleTrace) -> None:
@@ -420,17 +560,46 @@ class ObservabilityManager:
             }
             
             self._drift_alerts.append(alert)
+            self._count_drift_alert(alert["severity"] == "high")
             
             logger.warning(
                 "Personality drift detected: magnitude=%.3f, threshold=%.3f",
                 drift_magnitude, self.config.drift_threshold
             )
     
+    def _count_drift_alert(self, high_severity: bool) -> None:
+        """Increment the drift counters for the current hour."""
+        hour = int(time.time()) // 3600
+        if not self._drift_buckets or self._drift_buckets[-1][0] != hour:
+            self._drift_buckets.append([hour, 0, 0])
+            self._rotate_drift_buckets(hour)
+        
+        bucket = self._drift_buckets[-1]
+        bucket[1] += 1
+        if high_severity:
+            bucket[2] += 1
+    
+    def _rotate_drift_buckets(self, hour: int) -> None:
+        """Drop drift counters that fell out of the health window."""
+        oldest = hour - DRIFT_WINDOW_HOURS + 1
+        while self._drift_buckets and self._drift_buckets[0][0] < oldest:
+            self._drift_buckets.popleft()
+    
+    def _drift_counts(self) -> Tuple[int, int]:
+        """Get (total, high severity) drift alert counts for the health window."""
+        self._rotate_drift_buckets(int(time.time()) // 3600)
+        total = sum(bucket[1] for bucket in self._drift_buckets)
+        high = sum(bucket[2] for bucket in self._drift_buckets)
+        return total, high
+    
     def clear_all_data(self) -> None:
         """Clear all stored data (for testing/debugging)."""
         self._traces.clear()
+        self._trace_chunks.clear()
         self._metrics.clear()
         self._drift_alerts.clear()
+        self._drift_buckets.clear()
+        self._cached_summary = None
         
         for operation in self._performance_metrics:
             self._performance_metrics[operation].clear()
@@ -462,7 +631,7 @@ class ObservabilityManager:
         
         for operation, entries in self._performance_metrics.items():
             if entries:
-                avg_duration = sum(entry["duration"] for entry in entries) / len(entries)
+                avg_duration = sum(entry.value for entry in entries) / len(entries)
                 if avg_duration > 1.0:  # More than 1 second average
                     performance_health["status"] = "warning"
                     performance_health["message"] = f"Slow performance detected in {operation}"
@@ -474,15 +643,14 @@ class ObservabilityManager:
             "message": "No significant drift detected",
         }
         
-        recent_alerts = self.get_drift_alerts(24)
-        if len(recent_alerts) > 5:
+        recent_count, high_severity_count = self._drift_counts()
+        if recent_count > 5:
             drift_health["status"] = "warning"
-            drift_health["message"] = f"Multiple drift alerts in last 24 hours: {len(recent_alerts)}"
+            drift_health["message"] = f"Multiple drift alerts in last 24 hours: {recent_count}"
         
-        high_severity_alerts = [alert for alert in recent_alerts if alert["severity"] == "high"]
-        if high_severity_alerts:
+        if high_severity_count:
             drift_health["status"] = "critical"
-            drift_health["message"] = f"High severity drift alerts detected: {len(high_severity_alerts)}"
+            drift_health["message"] = f"High severity drift alerts detected: {high_severity_count}"
         
         return {
             "overall_status": "healthy" if all(
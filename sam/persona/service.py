@@ -11,13 +11,15 @@ import logging
 import os
 import signal
 import sys
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
 
 from .core import PersonalityMatrix
@@ -28,7 +30,7 @@ from .models import (
     PersonalityConfig,
     StateUpdate,
 )
-from .api import create_api_router
+from .api import HealthResponse, create_api_router
 
 
 # Configure logging
@@ -47,6 +49,9 @@ logger = logging.getLogger(__name__)
 class PersonalityMatrixService:
     """Main service class for the Personality Matrix daemon."""
     
+    # Seconds a serialized health response is reused for repeated probes
+    HEALTH_CACHE_TTL = 1.0
+    
     def __init__(self, config: Optional[PersonalityConfig] = None):
         """
         Initialize the Personality Matrix service.
@@ -63,6 +68,10 @@ class PersonalityMatrixService:
         self._running = False
         self._shutdown_event = asyncio.Event()
         
+        # Cached health check body and its expiry (monotonic seconds)
+        self._health_body: Optional[bytes] = None
+        self._health_expires = 0.0
+        
         logger.info("Personality Matrix Service initialized")
     
     async def start(self, host: str = "0.0.0.0", port: int = 8001) -> None:
@@ -99,7 +108,7 @@ class PersonalityMatrixService:
             self._running = True
             
             # Set up signal handlers
-            self._setup_signal_handlers()
+            await self._setup_signal_handlers()
             
             # Start the server
             await self.server.serve()
@@ -145,6 +154,7 @@ class PersonalityMatrixService:
             description="API for Sam's Personality Matrix (PMX) component",
             version="1.0.0",
             lifespan=lifespan,
+            default_response_class=ORJSONResponse,
         )
         
         # Add CORS middleware
@@ -171,12 +181,18 @@ class PersonalityMatrixService:
             if not self.pmx:
                 raise HTTPException(status_code=503, detail="Service not initialized")
             
-            return {
-                "status": "healthy",
-                "service": "personality-matrix",
-                "version": "1.0.0",
-                "personality": self.pmx.get_personality_summary(),
-            }
+            now = time.monotonic()
+            if self._health_body is None or now >= self._health_expires:
+                health = HealthResponse(
+                    status="healthy",
+                    service="personality-matrix",
+                    version="1.0.0",
+                    personality=self.pmx.get_personality_summary(),
+                )
+                self._health_body = health.model_dump_json().encode("utf-8")
+                self._health_expires = now + self.HEALTH_CACHE_TTL
+            
+            return Response(content=self._health_body, media_type="application/json")
         
         # Add root endpoint
         @app.get("/")
@@ -195,19 +211,26 @@ class PersonalityMatrixService:
         
         return app
     
-    def _setup_signal_handlers(self) -> None:
-        """Set up signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
+    async def _setup_signal_handlers(self) -> None:
+        """Set up signal handlers for graceful shutdown on the running loop."""
+        loop = asyncio.get_running_loop()
+        
+        def signal_handler(signum: int) -> None:
             logger.info("Received signal %d, initiating shutdown", signum)
             asyncio.create_task(self.stop())
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, signal_handler, signum)
+            except NotImplementedError:
+                # Event loops without signal support (e.g. on Windows)
+                logger.warning("Signal handlers not supported on this event loop")
+                break
     
-    async def _validation_error_handler(self, request: Request, exc: ValidationError) -> JSONResponse:
+    async def _validation_error_handler(self, request: Request, exc: ValidationError) -> ORJSONResponse:
         """Handle validation errors."""
         logger.warning("Validation error: %s", exc.errors())
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": "Validation error",
@@ -215,10 +238,10 @@ class PersonalityMatrixService:
             }
         )
     
-    async def _general_error_handler(self, request: Request, exc: Exception) -> JSONResponse:
+    async def _general_error_handler(self, request: Request, exc: Exception) -> ORJSONResponse:
         """Handle general errors."""
         logger.error("Unhandled exception: %s", exc, exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
@@ -249,9 +272,8 @@ def main():
     if args.config:
         try:
             # Load configuration from file
-            import json
-            with open(args.config, 'r') as f:
-                config_data = json.load(f)
+            with open(args.config, 'rb') as f:
+                config_data = orjson.loads(f.read())
             config = PersonalityConfig(**config_data)
             logger.info("Loaded configuration from %s", args.config)
         except Exception as e:
@@ -6,13 +6,18 @@ and other affective states with natural decay and event-based adjustments.
 """
 
 import logging
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Final, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 
+from ._jit import njit
 from .models import (
     AffectiveState,
+    AudienceType,
+    ChannelType,
     EventType,
     PersonalityConfig,
     StateUpdate,
@@ -21,6 +26,253 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Affective state vectors hold (valence, arousal, fatigue)
+_STATE_DTYPE = np.float32
+
+# Affective impact (valence, arousal, fatigue) of each event type
+_EVENT_IMPACTS: Final[Mapping[EventType, Tuple[float, float, float]]] = MappingProxyType({
+    EventType.POSITIVE_INTERACTION: (0.3, 0.2, -0.1),
+    EventType.NEGATIVE_INTERACTION: (-0.4, 0.3, 0.1),
+    EventType.ACHIEVEMENT: (0.5, 0.4, -0.2),
+    EventType.FAILURE: (-0.6, 0.2, 0.3),
+    EventType.SURPRISE: (0.1, 0.6, 0.0),
+    EventType.BOREDOM: (-0.2, -0.3, 0.2),
+    EventType.STRESS: (-0.3, 0.5, 0.4),
+    EventType.RELAXATION: (0.2, -0.4, -0.1),
+    EventType.CREATIVITY: (0.4, 0.3, 0.1),
+    EventType.LEARNING: (0.3, 0.2, 0.2),
+    EventType.SOCIAL: (0.2, 0.3, -0.1),
+    EventType.SOLITARY: (0.1, -0.2, 0.0),
+})
+
+# Rules for state transitions and interactions
+_TRANSITION_RULES: Final[Mapping[str, Mapping[str, float]]] = MappingProxyType({
+    "valence_arousal": MappingProxyType({
+        "high_valence_high_arousal": 0.1,  # Excitement
+        "low_valence_high_arousal": -0.1,  # Anxiety
+        "high_valence_low_arousal": 0.05,  # Contentment
+        "low_valence_low_arousal": -0.05,  # Sadness
+    }),
+    "fatigue_impact": MappingProxyType({
+        "high_fatigue_valence": -0.2,  # Fatigue reduces positive mood
+        "high_fatigue_arousal": -0.3,  # Fatigue reduces energy
+    }),
+    "recovery_rules": MappingProxyType({
+        "valence_recovery_rate": 0.1,  # Natural recovery toward setpoint
+        "arousal_recovery_rate": 0.15,  # Faster arousal recovery
+        "fatigue_recovery_rate": 0.2,  # Fastest fatigue recovery
+    }),
+})
+
+# Event impacts as a table with one row per event type, in EventType order
+_EVENT_INDEX = {event_type: index for index, event_type in enumerate(EventType)}
+_EVENT_IMPACT_TABLE = np.array(
+    [_EVENT_IMPACTS[event_type] for event_type in EventType], dtype=_STATE_DTYPE
+)
+
+# Context modifiers of event impact, one (valence, arousal, fatigue) row per
+# audience type, channel type and hour; the extra last row is neutral. They
+# are kept in float64 so scalar updates see the exact modifier values.
+_AUDIENCE_INDEX = {audience_type: index for index, audience_type in enumerate(AudienceType)}
+_NO_AUDIENCE = len(AudienceType)
+_AUDIENCE_MODIFIERS = np.ones((len(AudienceType) + 1, 3))
+_AUDIENCE_MODIFIERS[_AUDIENCE_INDEX[AudienceType.FRIEND]] = (1.2, 1.0, 1.0)  # More positive with friends
+_AUDIENCE_MODIFIERS[_AUDIENCE_INDEX[AudienceType.PROFESSIONAL]] = (1.0, 0.8, 1.0)  # More controlled
+_AUDIENCE_MODIFIERS[_AUDIENCE_INDEX[AudienceType.CHILD]] = (1.3, 1.1, 1.0)  # More positive with children
+
+_CHANNEL_INDEX = {channel_type: index for index, channel_type in enumerate(ChannelType)}
+_NO_CHANNEL = len(ChannelType)
+_CHANNEL_MODIFIERS = np.ones((len(ChannelType) + 1, 3))
+_CHANNEL_MODIFIERS[_CHANNEL_INDEX[ChannelType.VOICE]] = (1.0, 1.1, 1.0)  # Voice is more engaging
+_CHANNEL_MODIFIERS[_CHANNEL_INDEX[ChannelType.EMAIL]] = (1.0, 0.9, 1.0)  # Email is less immediate
+
+_NO_HOUR = 24
+_LATE_NIGHT_HOURS = (22, 23, 0, 1, 2, 3, 4, 5, 6)
+_HOUR_MODIFIERS = np.ones((25, 3))
+_HOUR_MODIFIERS[list(_LATE_NIGHT_HOURS)] = (1.0, 0.7, 1.2)  # Late night
+
+# Combined modifiers indexed by [audience, channel, hour] ordinals
+_CONTEXT_MODIFIERS = (
+    _AUDIENCE_MODIFIERS[:, None, None, :]
+    * _CHANNEL_MODIFIERS[None, :, None, :]
+    * _HOUR_MODIFIERS[None, None, :, :]
+)
+
+# Hour-of-day modifiers only differ between late night and the rest of the day
+_LATE_NIGHT = tuple(hour in _LATE_NIGHT_HOURS for hour in range(24))
+
+
+@lru_cache(maxsize=256)
+def _context_modifiers(
+    audience_type: Optional[AudienceType],
+    channel_type: Optional[ChannelType],
+    late_night: bool
+) -> Tuple[float, float, float]:
+    """Get the (valence, arousal, fatigue) modifiers for an event context."""
+    audience = _NO_AUDIENCE if audience_type is None else _AUDIENCE_INDEX[audience_type]
+    channel = _NO_CHANNEL if channel_type is None else _CHANNEL_INDEX[channel_type]
+    hour = _LATE_NIGHT_HOURS[0] if late_night else _NO_HOUR  # any late-night hour
+    return tuple(_CONTEXT_MODIFIERS[audience, channel, hour].tolist())
+
+
+@lru_cache(maxsize=256)
+def _event_impact(
+    event_type: EventType,
+    intensity: float,
+    audience_type: Optional[AudienceType],
+    channel_type: Optional[ChannelType],
+    late_night: bool
+) -> Tuple[float, float, float]:
+    """Get the (valence, arousal, fatigue) impact of an event in its context."""
+    # Base impact for this event type
+    valence, arousal, fatigue = _EVENT_IMPACTS[event_type]
+    
+    # Scale by intensity and context modifiers
+    valence_mod, arousal_mod, fatigue_mod = _context_modifiers(
+        audience_type, channel_type, late_night
+    )
+    return (
+        valence * intensity * valence_mod,
+        arousal * intensity * arousal_mod,
+        fatigue * intensity * fatigue_mod,
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _update_kernel(
+    valence, arousal, fatigue, decay,
+    event_valence, event_arousal, event_fatigue,
+    valence_setpoint, arousal_setpoint,
+    valence_recovery, arousal_recovery, fatigue_recovery,
+    excitement, anxiety, contentment, sadness,
+    fatigue_valence, fatigue_arousal,
+):
+    """
+    Apply decay, event impact, interactions, recovery and clamping to one state.
+    
+    Compiled with Numba when it is installed; otherwise runs as plain Python
+    on floats. Returns the new (valence, arousal, fatigue).
+    """
+    # Apply natural decay
+    valence *= decay
+    arousal *= decay
+    fatigue *= decay
+    
+    # Interactions of the decayed state; the quadrants are mutually exclusive
+    high_valence = valence > 0.5
+    low_valence = valence < -0.5
+    high_arousal = arousal > 0.5
+    low_arousal = arousal < 0.3
+    high_fatigue = fatigue > 0.7
+    interaction_valence = (
+        excitement * (high_valence and high_arousal)
+        + anxiety * (low_valence and high_arousal)
+        + contentment * (high_valence and low_arousal)
+        + sadness * (low_valence and low_arousal)
+        + fatigue_valence * high_fatigue
+    )
+    interaction_arousal = fatigue_arousal * high_fatigue
+    
+    # Combine impacts
+    valence += event_valence + interaction_valence
+    arousal += event_arousal + interaction_arousal
+    fatigue += event_fatigue
+    
+    # Apply recovery toward setpoints (fatigue recovers toward 0)
+    valence += (valence_setpoint - valence) * valence_recovery
+    arousal += (arousal_setpoint - arousal) * arousal_recovery
+    fatigue -= fatigue * fatigue_recovery
+    
+    # Clamp values to valid ranges
+    return (
+        min(max(valence, -1.0), 1.0),
+        min(max(arousal, 0.0), 1.0),
+        min(max(fatigue, 0.0), 1.0),
+    )
+
+
+def _derive_state_tags(valence: float, arousal: float, fatigue: float) -> List[str]:
+    """Derive state tags from affective values."""
+    tags = []
+    
+    # Valence-based tags
+    if valence > 0.5:
+        tags.append("positive")
+    elif valence < -0.5:
+        tags.append("negative")
+    else:
+        tags.append("neutral")
+    
+    # Arousal-based tags
+    if arousal > 0.7:
+        tags.append("excited")
+    elif arousal > 0.4:
+        tags.append("engaged")
+    elif arousal < 0.3:
+        tags.append("calm")
+    
+    # Fatigue-based tags
+    if fatigue > 0.7:
+        tags.append("tired")
+    elif fatigue > 0.4:
+        tags.append("moderate_energy")
+    else:
+        tags.append("energetic")
+    
+    # Combined state tags
+    if valence > 0.6 and arousal > 0.6:
+        tags.append("enthusiastic")
+    elif valence < -0.6 and arousal > 0.6:
+        tags.append("anxious")
+    elif valence > 0.6 and arousal < 0.3:
+        tags.append("content")
+    elif valence < -0.6 and arousal < 0.3:
+        tags.append("sad")
+    
+    return tags
+
+
+# Tags only change at a few thresholds, so they are precomputed for every
+# combination of valence, arousal and fatigue bucket. The bucket boundaries
+# are the thresholds used by _derive_state_tags; each sample value lies
+# strictly inside its bucket.
+_VALENCE_SAMPLES = (-0.8, -0.55, 0.0, 0.55, 0.8)
+_AROUSAL_SAMPLES = (0.1, 0.35, 0.5, 0.65, 0.9)
+_FATIGUE_SAMPLES = (0.2, 0.5, 0.9)
+_TAG_TABLE = tuple(
+    tuple(_derive_state_tags(valence, arousal, fatigue))
+    for valence in _VALENCE_SAMPLES
+    for arousal in _AROUSAL_SAMPLES
+    for fatigue in _FATIGUE_SAMPLES
+)
+
+
+def _state_to_vec(state: AffectiveState) -> np.ndarray:
+    """Pack the affective components of a state into a vector."""
+    return np.array((state.valence, state.arousal, state.fatigue), dtype=_STATE_DTYPE)
+
+
+def _vec_to_state(
+    vec: np.ndarray,
+    tags: List[str],
+    decay: float,
+    ts: datetime
+) -> AffectiveState:
+    """
+    Build an affective state from a clamped (valence, arousal, fatigue) vector.
+    
+    The values are already in range, so model validation is skipped.
+    """
+    valence, arousal, fatigue = vec.tolist()
+    return AffectiveState.model_construct(
+        ts=ts,
+        valence=valence,
+        arousal=arousal,
+        fatigue=fatigue,
+        tags=list(tags),
+        decay=decay,
+    )
+
 
 class StateEngine:
     """
@@ -39,327 +291,262 @@ class StateEngine:
         """
         self.config = config
         
-        # Event impact mappings
-        self._event_impacts = self._initialize_event_impacts()
+        # Setpoints as plain floats for the scalar paths
+        self._valence_setpoint = float(config.valence_setpoint)
+        self._arousal_setpoint = float(config.arousal_setpoint)
+        
+        # Vector forms of setpoints, recovery rates and valid ranges
+        recovery_rules = _TRANSITION_RULES["recovery_rules"]
+        self._setpoints = np.array(
+            [config.valence_setpoint, config.arousal_setpoint, 0.0], dtype=_STATE_DTYPE
+        )
+        self._recovery_rates = np.array(
+            [
+                recovery_rules["valence_recovery_rate"],
+                recovery_rules["arousal_recovery_rate"],
+                recovery_rules["fatigue_recovery_rate"],
+            ],
+            dtype=_STATE_DTYPE,
+        )
+        self._lo = np.array([-1.0, 0.0, 0.0], dtype=_STATE_DTYPE)
+        self._hi = np.array([1.0, 1.0, 1.0], dtype=_STATE_DTYPE)
+        
+        # Interaction impacts, one row per condition checked in
+        # _calculate_state_interactions
+        valence_arousal = _TRANSITION_RULES["valence_arousal"]
+        fatigue_impact = _TRANSITION_RULES["fatigue_impact"]
+        self._interaction_impacts = np.array(
+            [
+                [valence_arousal["high_valence_high_arousal"], 0.0, 0.0],
+                [valence_arousal["low_valence_high_arousal"], 0.0, 0.0],
+                [valence_arousal["high_valence_low_arousal"], 0.0, 0.0],
+                [valence_arousal["low_valence_low_arousal"], 0.0, 0.0],
+                [
+                    fatigue_impact["high_fatigue_valence"],
+                    fatigue_impact["high_fatigue_arousal"],
+                    0.0,
+                ],
+            ],
+            dtype=_STATE_DTYPE,
+        )
+        
+        # Scalar parameters of _update_kernel after the per-update arguments
+        self._kernel_params = (
+            self._valence_setpoint,
+            self._arousal_setpoint,
+            recovery_rules["valence_recovery_rate"],
+            recovery_rules["arousal_recovery_rate"],
+            recovery_rules["fatigue_recovery_rate"],
+            valence_arousal["high_valence_high_arousal"],
+            valence_arousal["low_valence_high_arousal"],
+            valence_arousal["high_valence_low_arousal"],
+            valence_arousal["low_valence_low_arousal"],
+            fatigue_impact["high_fatigue_valence"],
+            fatigue_impact["high_fatigue_arousal"],
+        )
         
-        # State transition rules
-        self._transition_rules = self._initialize_transition_rules()
+        # Debug logging is checked once here rather than on every update;
+        # enable it before constructing the engine to trace updates
+        self._debug = logger.isEnabledFor(logging.DEBUG)
         
         logger.info("State Engine initialized")
     
-    def _initialize_event_impacts(self) -> Dict[EventType, Dict[str, float]]:
-        """Initialize the mapping of event types to their affective impacts."""
-        return {
-            EventType.POSITIVE_INTERACTION: {
-                "valence": 0.3,
-                "arousal": 0.2,
-                "fatigue": -0.1,
-            },
-            EventType.NEGATIVE_INTERACTION: {
-                "valence": -0.4,
-                "arousal": 0.3,
-                "fatigue": 0.1,
-            },
-            EventType.ACHIEVEMENT: {
-                "valence": 0.5,
-                "arousal": 0.4,
-                "fatigue": -0.2,
-            },
-            EventType.FAILURE: {
-                "valence": -0.6,
-                "arousal": 0.2,
-                "fatigue": 0.3,
-            },
-            EventType.SURPRISE: {
-                "valence": 0.1,
-                "arousal": 0.6,
-                "fatigue": 0.0,
-            },
-            EventType.BOREDOM: {
-                "valence": -0.2,
-                "arousal": -0.3,
-                "fatigue": 0.2,
-            },
-            EventType.STRESS: {
-                "valence": -0.3,
-                "arousal": 0.5,
-                "fatigue": 0.4,
-            },
-            EventType.RELAXATION: {
-                "valence": 0.2,
-                "arousal": -0.4,
-                "fatigue": -0.1,
-            },
-            EventType.CREATIVITY: {
-                "valence": 0.4,
-                "arousal": 0.3,
-                "fatigue": 0.1,
-            },
-            EventType.LEARNING: {
-                "valence": 0.3,
-                "arousal": 0.2,
-                "fatigue": 0.2,
-            },
-            EventType.SOCIAL: {
-                "valence": 0.2,
-                "arousal": 0.3,
-                "fatigue": -0.1,
-            },
-            EventType.SOLITARY: {
-                "valence": 0.1,
-                "arousal": -0.2,
-                "fatigue": 0.0,
-            },
-        }
-    
-    def _initialize_transition_rules(self) -> Dict[str, Dict[str, float]]:
-        """Initialize rules for state transitions and interactions."""
-        return {
-            "valence_arousal": {
-                "high_valence_high_arousal": 0.1,  # Excitement
-                "low_valence_high_arousal": -0.1,  # Anxiety
-                "high_valence_low_arousal": 0.05,  # Contentment
-                "low_valence_low_arousal": -0.05,  # Sadness
-            },
-            "fatigue_impact": {
-                "high_fatigue_valence": -0.2,  # Fatigue reduces positive mood
-                "high_fatigue_arousal": -0.3,  # Fatigue reduces energy
-            },
-            "recovery_rules": {
-                "valence_recovery_rate": 0.1,  # Natural recovery toward setpoint
-                "arousal_recovery_rate": 0.15,  # Faster arousal recovery
-                "fatigue_recovery_rate": 0.2,  # Fastest fatigue recovery
-            },
-        }
-    
-    def update_state(self, current_state: AffectiveState, update: StateUpdate) -> AffectiveState:
+    def update_state(
+        self,
+        current_state: AffectiveState,
+        update: StateUpdate,
+        now: Optional[datetime] = None
+    ) -> AffectiveState:
         """
         Update the affective state based on an event.
         
         Args:
             current_state: Current affective state
             update: State update containing event information
+            now: Optional timestamp for the new state (defaults to the current time)
             
         Returns:
             Updated affective state
         """
-        logger.debug("Updating state for event: %s (intensity: %.2f)", 
-                    update.event_type, update.intensity)
+        if self._debug:
+            logger.debug("Updating state for event: %s (intensity: %.2f)",
+                        update.event_type, update.intensity)
+        
+        # Resolve the event impact from the lookup tables
+        event_valence, event_arousal, event_fatigue = self._calculate_event_impact(update)
+        
+        # Decay, interactions, recovery and clamping run in the numeric kernel
+        valence, arousal, fatigue = _update_kernel(
+            current_state.valence,
+            current_state.arousal,
+            current_state.fatigue,
+            current_state.decay,
+            event_valence,
+            event_arousal,
+            event_fatigue,
+            *self._kernel_params,
+        )
         
-        # Apply natural decay
-        decayed_state = self._apply_decay(current_state)
+        # Build the new state once, with tags derived from its values; the
+        # kernel output is clamped, so model validation is skipped
+        new_state = AffectiveState.model_construct(
+            ts=now or datetime.utcnow(),
+            valence=valence,
+            arousal=arousal,
+            fatigue=fatigue,
+            tags=list(self._update_state_tags(valence, arousal, fatigue)),
+            decay=current_state.decay,
+        )
         
-        # Apply event impact
-        event_impact = self._calculate_event_impact(update)
+        if self._debug:
+            logger.debug("State updated: valence=%.2f, arousal=%.2f, fatigue=%.2f",
+                        new_state.valence, new_state.arousal, new_state.fatigue)
         
-        # Apply state interactions
-        interaction_impact = self._calculate_state_interactions(decayed_state)
+        return new_state
+    
+    def update_state_batch(
+        self,
+        states: np.ndarray,
+        decays: np.ndarray,
+        event_type_ids: np.ndarray,
+        intensities: np.ndarray,
+        audience_ids: np.ndarray,
+        channel_ids: np.ndarray,
+        hours: np.ndarray
+    ) -> np.ndarray:
+        """
+        Update many affective states at once.
         
-        # Combine all impacts
-        new_state = self._combine_impacts(decayed_state, event_impact, interaction_impact)
+        Applies the same decay, event impact, interaction, recovery and clamp
+        steps as :meth:`update_state` to every row. Index arrays for a list of
+        updates can be built with :meth:`encode_updates`.
         
-        # Apply recovery toward setpoints
-        new_state = self._apply_recovery(new_state)
+        Args:
+            states: (N, 3) array of (valence, arousal, fatigue) rows
+            decays: (N,) decay rate of each state
+            event_type_ids: (N,) event type table indices
+            intensities: (N,) event intensities
+            audience_ids: (N,) audience type table indices
+            channel_ids: (N,) channel type table indices
+            hours: (N,) hour of day of each event (24 for none)
+            
+        Returns:
+            (N, 3) array of updated states
+        """
+        states = np.array(states, dtype=_STATE_DTYPE)
         
-        # Clamp values to valid ranges
-        new_state = self._clamp_state_values(new_state)
+        # Apply natural decay
+        states *= np.asarray(decays, dtype=_STATE_DTYPE)[:, None]
         
-        # Update tags based on new state
-        new_state.tags = self._update_state_tags(new_state)
+        # Event impacts scaled by intensity and context modifiers
+        modifiers = _CONTEXT_MODIFIERS[audience_ids, channel_ids, hours]
+        event_impact = _EVENT_IMPACT_TABLE[event_type_ids] * (
+            np.asarray(intensities, dtype=_STATE_DTYPE)[:, None] * modifiers
+        )
         
-        # Update timestamp
-        new_state.ts = datetime.utcnow()
+        # Combine with state interactions of the decayed states
+        states += event_impact + self._calculate_state_interactions_batch(states)
         
-        logger.debug("State updated: valence=%.2f, arousal=%.2f, fatigue=%.2f",
-                    new_state.valence, new_state.arousal, new_state.fatigue)
+        # Apply recovery toward setpoints and clamp
+        states += (self._setpoints - states) * self._recovery_rates
+        np.clip(states, self._lo, self._hi, out=states)
         
-        return new_state
+        return states
     
-    def _apply_decay(self, state: AffectiveState) -> AffectiveState:
-        """Apply natural decay to the current state."""
-        decay_rate = state.decay
-        
-        # Apply decay to each component
-        new_valence = state.valence * decay_rate
-        new_arousal = state.arousal * decay_rate
-        new_fatigue = state.fatigue * decay_rate
-        
-        return AffectiveState(
-            valence=new_valence,
-            arousal=new_arousal,
-            fatigue=new_fatigue,
-            tags=state.tags.copy(),
-            decay=state.decay
-        )
-    
-    def _calculate_event_impact(self, update: StateUpdate) -> Dict[str, float]:
-        """Calculate the impact of an event on affective state."""
-        event_type = update.event_type
-        intensity = update.intensity
-        
-        # Get base impact for this event type
-        base_impact = self._event_impacts.get(event_type, {})
-        
-        # Scale by intensity
-        scaled_impact = {}
-        for component, impact in base_impact.items():
-            scaled_impact[component] = impact * intensity
-        
-        # Apply context modifiers
-        context_modifiers = self._calculate_context_modifiers(update)
-        for component, modifier in context_modifiers.items():
-            if component in scaled_impact:
-                scaled_impact[component] *= modifier
-        
-        return scaled_impact
-    
-    def _calculate_context_modifiers(self, update: StateUpdate) -> Dict[str, float]:
-        """Calculate context-based modifiers for event impact."""
-        modifiers = {"valence": 1.0, "arousal": 1.0, "fatigue": 1.0}
-        
-        # Audience modifiers
-        if update.audience:
-            if update.audience.type.value == "friend":
-                modifiers["valence"] *= 1.2  # More positive with friends
-            elif update.audience.type.value == "professional":
-                modifiers["arousal"] *= 0.8  # More controlled in professional settings
-            elif update.audience.type.value == "child":
-                modifiers["valence"] *= 1.3  # More positive with children
-                modifiers["arousal"] *= 1.1
-        
-        # Channel modifiers
-        if update.channel:
-            if update.channel.type.value == "voice":
-                modifiers["arousal"] *= 1.1  # Voice is more engaging
-            elif update.channel.type.value == "email":
-                modifiers["arousal"] *= 0.9  # Email is less immediate
-        
-        # Time-based modifiers (if available)
-        if update.timestamp:
-            hour = update.timestamp.hour
-            if 22 <= hour or hour <= 6:  # Late night
-                modifiers["arousal"] *= 0.7
-                modifiers["fatigue"] *= 1.2
-        
-        return modifiers
-    
-    def _calculate_state_interactions(self, state: AffectiveState) -> Dict[str, float]:
-        """Calculate interactions between different state components."""
-        interactions = {"valence": 0.0, "arousal": 0.0, "fatigue": 0.0}
-        
-        # Valence-Arousal interactions
-        if state.valence > 0.5 and state.arousal > 0.5:
-            interactions["valence"] += self._transition_rules["valence_arousal"]["high_valence_high_arousal"]
-        elif state.valence < -0.5 and state.arousal > 0.5:
-            interactions["valence"] += self._transition_rules["valence_arousal"]["low_valence_high_arousal"]
-        elif state.valence > 0.5 and state.arousal < 0.3:
-            interactions["valence"] += self._transition_rules["valence_arousal"]["high_valence_low_arousal"]
-        elif state.valence < -0.5 and state.arousal < 0.3:
-            interactions["valence"] += self._transition_rules["valence_arousal"]["low_valence_low_arousal"]
-        
-        # Fatigue interactions
-        if state.fatigue > 0.7:
-            interactions["valence"] += self._transition_rules["fatigue_impact"]["high_fatigue_valence"]
-            interactions["arousal"] += self._transition_rules["fatigue_impact"]["high_fatigue_arousal"]
-        
-        return interactions
-    
-    def _combine_impacts(
+    def encode_updates(
         self,
-        decayed_state: AffectiveState,
-        event_impact: Dict[str, float],
-        interaction_impact: Dict[str, float]
-    ) -> AffectiveState:
-        """Combine all impacts to create the new state."""
-        # Start with decayed state
-        new_valence = decayed_state.valence
-        new_arousal = decayed_state.arousal
-        new_fatigue = decayed_state.fatigue
-        
-        # Add event impacts
-        new_valence += event_impact.get("valence", 0.0)
-        new_arousal += event_impact.get("arousal", 0.0)
-        new_fatigue += event_impact.get("fatigue", 0.0)
-        
-        # Add interaction impacts
-        new_valence += interaction_impact.get("valence", 0.0)
-        new_arousal += interaction_impact.get("arousal", 0.0)
-        new_fatigue += interaction_impact.get("fatigue", 0.0)
-        
-        return AffectiveState(
-            valence=new_valence,
-            arousal=new_arousal,
-            fatigue=new_fatigue,
-            tags=decayed_state.tags.copy(),
-            decay=decayed_state.decay
+        updates: Sequence[StateUpdate]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Encode state updates as arrays for :meth:`update_state_batch`.
+        
+        Args:
+            updates: State updates to encode
+            
+        Returns:
+            Tuple of (event_type_ids, intensities, audience_ids, channel_ids, hours)
+        """
+        count = len(updates)
+        event_type_ids = np.fromiter(
+            (_EVENT_INDEX[update.event_type] for update in updates), dtype=np.intp, count=count
         )
-    
-    def _apply_recovery(self, state: AffectiveState) -> AffectiveState:
-        """Apply recovery toward setpoints."""
-        recovery_rules = self._transition_rules["recovery_rules"]
-        
-        # Calculate recovery toward setpoints
-        valence_recovery = (self.config.valence_setpoint - state.valence) * recovery_rules["valence_recovery_rate"]
-        arousal_recovery = (self.config.arousal_setpoint - state.arousal) * recovery_rules["arousal_recovery_rate"]
-        fatigue_recovery = (0.0 - state.fatigue) * recovery_rules["fatigue_recovery_rate"]  # Recover toward 0
-        
-        return AffectiveState(
-            valence=state.valence + valence_recovery,
-            arousal=state.arousal + arousal_recovery,
-            fatigue=state.fatigue + fatigue_recovery,
-            tags=state.tags.copy(),
-            decay=state.decay
+        intensities = np.fromiter(
+            (update.intensity for update in updates), dtype=_STATE_DTYPE, count=count
+        )
+        audience_ids = np.fromiter(
+            (
+                _AUDIENCE_INDEX[update.audience.type] if update.audience else _NO_AUDIENCE
+                for update in updates
+            ),
+            dtype=np.intp,
+            count=count,
+        )
+        channel_ids = np.fromiter(
+            (
+                _CHANNEL_INDEX[update.channel.type] if update.channel else _NO_CHANNEL
+                for update in updates
+            ),
+            dtype=np.intp,
+            count=count,
+        )
+        hours = np.fromiter(
+            (update.timestamp.hour if update.timestamp else _NO_HOUR for update in updates),
+            dtype=np.intp,
+            count=count,
         )
+        return event_type_ids, intensities, audience_ids, channel_ids, hours
     
-    def _clamp_state_values(self, state: AffectiveState) -> AffectiveState:
-        """Clamp state values to valid ranges."""
-        return AffectiveState(
-            valence=np.clip(state.valence, -1.0, 1.0),
-            arousal=np.clip(state.arousal, 0.0, 1.0),
-            fatigue=np.clip(state.fatigue, 0.0, 1.0),
-            tags=state.tags.copy(),
-            decay=state.decay
+    def _calculate_event_impact(self, update: StateUpdate) -> Tuple[float, float, float]:
+        """
+        Calculate the impact of an event on affective state.
+        
+        Impacts are memoized on the event type, intensity and context, since
+        the same events recur with the same few intensities.
+        """
+        return _event_impact(
+            update.event_type,
+            update.intensity,
+            update.audience.type if update.audience else None,
+            update.channel.type if update.channel else None,
+            _LATE_NIGHT[update.timestamp.hour] if update.timestamp else False,
         )
     
-    def _update_state_tags(self, state: AffectiveState) -> List[str]:
-        """Update state tags based on current values."""
-        tags = []
-        
-        # Valence-based tags
-        if state.valence > 0.5:
-            tags.append("positive")
-        elif state.valence < -0.5:
-            tags.append("negative")
-        else:
-            tags.append("neutral")
-        
-        # Arousal-based tags
-        if state.arousal > 0.7:
-            tags.append("excited")
-        elif state.arousal > 0.4:
-            tags.append("engaged")
-        elif state.arousal < 0.3:
-            tags.append("calm")
-        
-        # Fatigue-based tags
-        if state.fatigue > 0.7:
-            tags.append("tired")
-        elif state.fatigue > 0.4:
-            tags.append("moderate_energy")
-        else:
-            tags.append("energetic")
-        
-        # Combined state tags
-        if state.valence > 0.6 and state.arousal > 0.6:
-            tags.append("enthusiastic")
-        elif state.valence < -0.6 and state.arousal > 0.6:
-            tags.append("anxious")
-        elif state.valence > 0.6 and state.arousal < 0.3:
-            tags.append("content")
-        elif state.valence < -0.6 and state.arousal < 0.3:
-            tags.append("sad")
-        
-        return tags
+    def _calculate_state_interactions_batch(self, states: np.ndarray) -> np.ndarray:
+        """Calculate state interactions for each row of an (N, 3) state array."""
+        valence, arousal, fatigue = states[:, 0], states[:, 1], states[:, 2]
+        high_valence = valence > 0.5
+        low_valence = valence < -0.5
+        high_arousal = arousal > 0.5
+        low_arousal = arousal < 0.3
+        
+        conditions = np.stack(
+            (
+                high_valence & high_arousal,
+                low_valence & high_arousal,
+                high_valence & low_arousal,
+                low_valence & low_arousal,
+                fatigue > 0.7,
+            ),
+            axis=1,
+        ).astype(_STATE_DTYPE)
+        
+        return conditions @ self._interaction_impacts
+    
+    def _clamp_vec(self, vec: np.ndarray) -> None:
+        """Clamp a state vector to valid ranges in place."""
+        np.clip(vec, self._lo, self._hi, out=vec)
+    
+    def _update_state_tags(self, valence: float, arousal: float, fatigue: float) -> Tuple[str, ...]:
+        """
+        Look up the state tags for the given affective values.
+        
+        Values must be Python floats: the buckets sum bools, and NumPy bool
+        scalars would combine with logical or instead.
+        """
+        valence_bucket = (valence >= -0.6) + (valence >= -0.5) + (valence > 0.5) + (valence > 0.6)
+        arousal_bucket = (arousal >= 0.3) + (arousal > 0.4) + (arousal > 0.6) + (arousal > 0.7)
+        fatigue_bucket = (fatigue > 0.4) + (fatigue > 0.7)
+        return _TAG_TABLE[(valence_bucket * 5 + arousal_bucket) * 3 + fatigue_bucket]
     
     def predict_state_evolution(
         self,
@@ -378,39 +565,82 @@ class StateEngine:
         Returns:
             List of predicted states over time
         """
-        predictions = []
-        current = current_state
-        
         # Calculate number of time steps (assuming 1-minute intervals)
         total_minutes = int(time_horizon.total_seconds() / 60)
         step_minutes = max(1, total_minutes // 10)  # 10 prediction points
+        offsets = range(0, total_minutes, step_minutes)
+        
+        # Each step applies decay then recovery, i.e. the affine map v -> a * v + b
+        a = current_state.decay * (1.0 - self._recovery_rates)
+        b = self._recovery_rates * self._setpoints
+        
+        trajectory = np.empty((len(offsets), 3), dtype=_STATE_DTYPE)
+        vec = _state_to_vec(current_state)
+        
+        # Simple heuristic: expected events apply a reduced impact at every
+        # step within the first 30 minutes
+        event_steps = sum(1 for i in offsets if i < 30) if expected_events else 0
+        if event_steps:
+            event_impact = np.sum(
+                [self._calculate_event_impact(event) for event in expected_events], axis=0
+            )
+            vec = self._evolve_affine(vec, a, b + event_impact * 0.1, trajectory[:event_steps])
+        self._evolve_affine(vec, a, b, trajectory[event_steps:])
+        
+        # Capture the base time once and advance it by a fixed step
+        step = timedelta(minutes=step_minutes)
+        ts = datetime.utcnow()
+        predictions = []
+        for row in trajectory:
+            predictions.append(_vec_to_state(row, current_state.tags, current_state.decay, ts))
+            ts += step
         
-        for i in range(0, total_minutes, step_minutes):
-            # Apply decay
-            current = self._apply_decay(current)
-            
-            # Apply recovery
-            current = self._apply_recovery(current)
-            
-            # Apply expected events if any
-            if expected_events:
-                for event in expected_events:
-                    # Simple heuristic: apply events that might occur around this time
-                    if i < 30:  # First 30 minutes
-                        event_impact = self._calculate_event_impact(event)
-                        current.valence += event_impact.get("valence", 0.0) * 0.1  # Reduced impact
-                        current.arousal += event_impact.get("arousal", 0.0) * 0.1
-                        current.fatigue += event_impact.get("fatigue", 0.0) * 0.1
-            
-            # Clamp values
-            current = self._clamp_state_values(current)
-            
-            # Update timestamp
-            current.ts = datetime.utcnow() + timedelta(minutes=i)
+        return predictions
+    
+    def _evolve_affine(
+        self,
+        vec: np.ndarray,
+        a: np.ndarray,
+        b: np.ndarray,
+        out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Iterate the clamped map v -> clamp(a * v + b) into the rows of ``out``.
+        
+        The unclamped recurrence has the closed form
+        v_k = a**k * (v_0 - v*) + v* with fixed point v* = b / (1 - a), so all
+        steps are computed at once. If any step leaves the valid range the
+        clamp is not affine, and the steps are iterated instead.
+        
+        Args:
+            vec: Starting state vector
+            a: Per-component multiplier (each below 1)
+            b: Per-component offset
+            out: Array receiving one row per step
             
-            predictions.append(current)
+        Returns:
+            State vector after the last step
+        """
+        steps = out.shape[0]
+        if steps == 0:
+            return vec
+        
+        fixed_point = b / (1.0 - a)
+        powers = a ** np.arange(1, steps + 1, dtype=_STATE_DTYPE)[:, None]
+        np.multiply(powers, vec - fixed_point, out=out)
+        out += fixed_point
+        
+        if (out < self._lo).any() or (out > self._hi).any():
+            current = vec.copy()
+            for row in out:
+                current *= a
+                current += b
+                self._clamp_vec(current)
+                row[:] = current
+        else:
+            np.clip(out, self._lo, self._hi, out=out)
         
-        return predictions
+        return out[-1].copy()
     
     def get_state_stability_score(self, state: AffectiveState) -> float:
         """
@@ -423,8 +653,8 @@ class StateEngine:
             Stability score between 0 and 1 (higher = more stable)
         """
         # Calculate distance from setpoints
-        valence_distance = abs(state.valence - self.config.valence_setpoint)
-        arousal_distance = abs(state.arousal - self.config.arousal_setpoint)
+        valence_distance = abs(state.valence - self._valence_setpoint)
+        arousal_distance = abs(state.arousal - self._arousal_setpoint)
         fatigue_distance = abs(state.fatigue - 0.0)  # Fatigue setpoint is 0
         
         # Average distance (lower = more stable)
@@ -433,4 +663,20 @@ class StateEngine:
         # Convert to stability score (1 - distance)
         stability = max(0.0, 1.0 - avg_distance)
         
-        return stability
\ No newline at end of file
+        return stability
+    
+    def get_state_stability_score_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Calculate stability scores for many states at once.
+        
+        The scalar get_state_stability_score stays plain Python, which is
+        faster than NumPy for a single state.
+        
+        Args:
+            states: Array of shape (n, 3) holding (valence, arousal, fatigue) rows
+            
+        Returns:
+            Array of n stability scores between 0 and 1 (higher = more stable)
+        """
+        avg_distance = np.abs(np.asarray(states) - self._setpoints).mean(axis=1)
+        return np.maximum(0.0, 1.0 - avg_distance)
\ No newline at end of file
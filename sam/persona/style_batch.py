@@ -0,0 +1,177 @@
+"""
+Column-oriented storage for batches of style profiles.
+
+This module holds many style profiles as parallel NumPy columns, one per
+profile field, so population-level operations such as boundary sweeps,
+decoding synthesis and compatibility matrices run over contiguous arrays
+instead of nested model objects.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from .models import (
+    BoundaryCaps,
+    BoundaryProfile,
+    DecodingProfile,
+    DictionProfile,
+    PacingProfile,
+    SensitivityLevel,
+    SentenceLength,
+    StanceProfile,
+    StyleProfile,
+    ToneProfile,
+)
+
+
+# Column dtypes; style values only need single precision
+FLOAT_DTYPE = np.float32
+INT_DTYPE = np.int32
+
+# Enum members in code order for the integer-coded columns
+SENTENCE_LENGTHS = tuple(SentenceLength)
+SENSITIVITY_LEVELS = tuple(SensitivityLevel)
+
+_SENTENCE_LENGTH_CODES = {length: code for code, length in enumerate(SENTENCE_LENGTHS)}
+_SENSITIVITY_CODES = {level: code for code, level in enumerate(SENSITIVITY_LEVELS)}
+
+
+class StyleProfileBatch:
+    """
+    Batch of style profiles stored as one NumPy column per field.
+
+    All columns are 1-D and aligned by row. Numeric fields are stored as
+    float32 or int32, and enum fields as uint8 codes indexing
+    :data:`SENTENCE_LENGTHS` and :data:`SENSITIVITY_LEVELS`.
+    """
+
+    __slots__ = (
+        "warmth",
+        "formality",
+        "humor",
+        "flirtation",
+        "sentence_len",
+        "metaphor",
+        "expansiveness",
+        "assertiveness",
+        "nsfw",
+        "sensitive",
+        "temp",
+        "top_p",
+        "top_k",
+        "penalty",
+        "max_tokens",
+    )
+
+    def __init__(self, size: int):
+        """
+        Allocate an uninitialized batch.
+
+        Args:
+            size: Number of profiles in the batch
+        """
+        self.warmth = np.empty(size, dtype=FLOAT_DTYPE)
+        self.formality = np.empty(size, dtype=FLOAT_DTYPE)
+        self.humor = np.empty(size, dtype=FLOAT_DTYPE)
+        self.flirtation = np.empty(size, dtype=FLOAT_DTYPE)
+        self.sentence_len = np.empty(size, dtype=np.uint8)
+        self.metaphor = np.empty(size, dtype=FLOAT_DTYPE)
+        self.expansiveness = np.empty(size, dtype=FLOAT_DTYPE)
+        self.assertiveness = np.empty(size, dtype=FLOAT_DTYPE)
+        self.nsfw = np.empty(size, dtype=bool)
+        self.sensitive = np.empty(size, dtype=np.uint8)
+        self.temp = np.empty(size, dtype=FLOAT_DTYPE)
+        self.top_p = np.empty(size, dtype=FLOAT_DTYPE)
+        self.top_k = np.empty(size, dtype=INT_DTYPE)
+        self.penalty = np.empty(size, dtype=FLOAT_DTYPE)
+        self.max_tokens = np.empty(size, dtype=INT_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.warmth)
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[StyleProfile]) -> "StyleProfileBatch":
+        """
+        Build a batch from style profiles.
+
+        Args:
+            profiles: Style profiles, one per row
+
+        Returns:
+            Batch holding the profile fields as columns
+        """
+        batch = cls(len(profiles))
+        for i, profile in enumerate(profiles):
+            batch.warmth[i] = profile.tone.warmth
+            batch.formality[i] = profile.tone.formality
+            batch.humor[i] = profile.tone.humor
+            batch.flirtation[i] = profile.tone.flirtation
+            batch.sentence_len[i] = _SENTENCE_LENGTH_CODES[profile.diction.sentence_len]
+            batch.metaphor[i] = profile.diction.metaphor
+            batch.expansiveness[i] = profile.pacing.expansiveness
+            batch.assertiveness[i] = profile.stance.assertiveness
+            batch.nsfw[i] = profile.boundaries.nsfw
+            batch.sensitive[i] = _SENSITIVITY_CODES[profile.boundaries.sensitive]
+            batch.temp[i] = profile.decoding.temp
+            batch.top_p[i] = profile.decoding.top_p
+            batch.top_k[i] = profile.decoding.top_k
+            batch.penalty[i] = profile.decoding.penalty
+            batch.max_tokens[i] = profile.decoding.max_tokens
+        return batch
+
+    def to_profile(self, index: int) -> StyleProfile:
+        """
+        Build the style profile stored at a row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Style profile for the row
+        """
+        return StyleProfile(
+            tone=ToneProfile(
+                warmth=float(self.warmth[index]),
+                formality=float(self.formality[index]),
+                humor=float(self.humor[index]),
+                flirtation=float(self.flirtation[index]),
+            ),
+            diction=DictionProfile(
+                sentence_len=SENTENCE_LENGTHS[self.sentence_len[index]],
+                metaphor=float(self.metaphor[index]),
+            ),
+            pacing=PacingProfile(expansiveness=float(self.expansiveness[index])),
+            stance=StanceProfile(assertiveness=float(self.assertiveness[index])),
+            boundaries=BoundaryProfile(
+                nsfw=bool(self.nsfw[index]),
+                sensitive=SENSITIVITY_LEVELS[self.sensitive[index]],
+            ),
+            decoding=DecodingProfile(
+                temp=float(self.temp[index]),
+                top_p=float(self.top_p[index]),
+                top_k=int(self.top_k[index]),
+                penalty=float(self.penalty[index]),
+                max_tokens=int(self.max_tokens[index]),
+            ),
+        )
+
+    def apply_boundaries(self, boundaries: BoundaryCaps) -> None:
+        """
+        Apply boundary caps to every profile in place.
+
+        Args:
+            boundaries: Boundary constraints
+        """
+        np.minimum(self.flirtation, boundaries.max_flirtation, out=self.flirtation)
+        np.minimum(self.humor, boundaries.max_humor, out=self.humor)
+        np.maximum(self.formality, boundaries.min_formality, out=self.formality)
+
+    def compatibility_features(self) -> np.ndarray:
+        """
+        Get the (N, 5) warmth, formality, humor, assertiveness and
+        expansiveness rows used for compatibility scoring.
+        """
+        return np.column_stack(
+            (self.warmth, self.formality, self.humor, self.assertiveness, self.expansiveness)
+        )
@@ -6,17 +6,28 @@ traits, states, audience context, and channel information.
 """
 
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 
+from ._jit import njit, prange
+from .style_batch import (
+    FLOAT_DTYPE,
+    SENSITIVITY_LEVELS,
+    SENTENCE_LENGTHS,
+    StyleProfileBatch,
+)
 from .models import (
     AffectiveState,
     AudienceContext,
+    AudienceType,
     BoundaryCaps,
     ChannelContext,
+    ChannelType,
     DecodingProfile,
     PersonalityConfig,
+    SensitivityLevel,
     SentenceLength,
     StyleProfile,
     ToneProfile,
@@ -30,6 +41,139 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Style levels produced by the linear blend, in output order
+_STYLE_LEVELS = ("warmth", "formality", "humor", "flirtation", "expansiveness", "assertiveness")
+
+# Blend coefficients over the synthesis inputs, one row per style level. The
+# inputs are (care, balance, candor, wit, curiosity, valence, arousal,
+# fatigue, valence * fatigue, 1), with valence mapped to [0, 1].
+_TRAIT_COEFFICIENTS = np.array(
+    [
+        [0.8, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # warmth
+        [0.0, 0.0, -0.6, -0.4, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0],  # formality
+        [0.0, 0.0, 0.0, 0.8, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0],  # humor
+        [0.0, 0.0, 0.4, 0.3, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # flirtation
+        [0.0, 0.0, 0.3, 0.0, 0.7, 0.0, 0.0, 0.0, 0.0, 0.0],  # expansiveness
+        [0.0, 0.2, 0.8, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # assertiveness
+    ]
+)
+_STATE_COEFFICIENTS = np.array(
+    [
+        [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0],  # warmth follows valence
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -0.3, 0.0, 0.0, 1.0],  # higher arousal = less formal
+        [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -0.5, 0.0],  # humor fades with fatigue
+        [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, -0.3, 0.0],  # flirtation fades with fatigue
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.6, -0.4, 0.0, 0.4],  # expansiveness
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.5, 0.5, 0.0, 0.0, 0.0],  # assertiveness
+    ]
+)
+
+# Weights of the (warmth, formality, humor, assertiveness, expansiveness)
+# differences in the compatibility score: tone, stance and pacing count equally
+_COMPATIBILITY_WEIGHTS = np.array(
+    [1.0 / 9.0, 1.0 / 9.0, 1.0 / 9.0, 1.0 / 3.0, 1.0 / 3.0], dtype=np.float32
+)
+
+# Decoding parameters as an affine map of the (warmth, humor, formality,
+# expansiveness, assertiveness) style values: base values and safe ranges of
+# (temp, top_p, top_k, penalty, max_tokens)
+_DECODING_BASE = np.array([0.7, 0.9, 50.0, 1.1, 800.0])
+_DECODING_LO = np.array([0.1, 0.1, 1.0, 0.1, 100.0])
+_DECODING_HI = np.array([2.0, 1.0, 100.0, 2.0, 4000.0])
+
+# Memoized styles are keyed by inputs quantized to 16 levels each
+STYLE_CACHE_SIZE = 4096
+_QUANT_STEPS = 15
+
+# Modifier table rows by enum ordinal; the extra last row is neutral
+_AUDIENCE_INDEX = {audience_type: index for index, audience_type in enumerate(AudienceType)}
+_NO_AUDIENCE = len(AudienceType)
+_CHANNEL_INDEX = {channel_type: index for index, channel_type in enumerate(ChannelType)}
+_NO_CHANNEL = len(ChannelType)
+
+# Sentence length codes indexed by 2 * long_rule + short_rule, where the long
+# rule takes precedence over the short rule
+_SENTENCE_LENGTH_LUT = np.array(
+    [
+        SENTENCE_LENGTHS.index(SentenceLength.MEDIUM),
+        SENTENCE_LENGTHS.index(SentenceLength.SHORT),
+        SENTENCE_LENGTHS.index(SentenceLength.LONG),
+        SENTENCE_LENGTHS.index(SentenceLength.LONG),
+    ],
+    dtype=np.uint8,
+)
+
+
+def _quantize(value: float) -> int:
+    """Quantize a value in [0, 1] to one of 16 levels."""
+    return int(value * _QUANT_STEPS + 0.5)
+
+
+def _dequantize(key: int, shift: int) -> float:
+    """Recover the value of the 4-bit level stored at ``shift`` in a packed key."""
+    return ((key >> shift) & 0xF) / _QUANT_STEPS
+
+
+def _clip(x: float, lo: float, hi: float) -> float:
+    """Clamp a scalar to [lo, hi] without NumPy dispatch overhead."""
+    return lo if x < lo else (hi if x > hi else x)
+
+
+def _sentence_length_codes(traits: np.ndarray, states: np.ndarray) -> np.ndarray:
+    """
+    Select the trait and state based sentence length of every row without branching.
+    
+    Applies the same rules as StyleSynthesizer._synthesize_diction before any
+    channel override.
+    
+    Args:
+        traits: (N, 5) array of (curiosity, balance, wit, candor, care) rows
+        states: (N, 3) array of (valence, arousal, fatigue) rows
+        
+    Returns:
+        (N,) uint8 codes indexing SENTENCE_LENGTHS
+    """
+    long_rule = (traits[:, 0] > 0.7) & (states[:, 1] > 0.5)
+    short_rule = (traits[:, 3] > 0.8) | (states[:, 2] > 0.6)
+    return _SENTENCE_LENGTH_LUT[2 * long_rule + short_rule]
+
+
+@njit(cache=True, parallel=True)
+def _synthesize_levels_kernel(
+    traits, states, audience_ids, channel_ids,
+    style_matrix, audience_modifiers, channel_modifiers, out,
+):
+    """
+    Blend, modify and clamp the style levels of every row into ``out``.
+    
+    Performs the same arithmetic as StyleSynthesizer._synthesize_levels, one
+    row per iteration, accumulating in double precision. Compiled with Numba
+    (rows run in parallel) when it is installed; otherwise runs as plain Python.
+    """
+    for i in prange(traits.shape[0]):
+        valence = (np.float64(states[i, 0]) + 1.0) / 2.0
+        fatigue = np.float64(states[i, 2])
+        inputs = (
+            np.float64(traits[i, 4]),  # care
+            np.float64(traits[i, 1]),  # balance
+            np.float64(traits[i, 3]),  # candor
+            np.float64(traits[i, 2]),  # wit
+            np.float64(traits[i, 0]),  # curiosity
+            valence,
+            np.float64(states[i, 1]),
+            fatigue,
+            valence * fatigue,
+            1.0,
+        )
+        for j in range(out.shape[1]):
+            level = 0.0
+            for k in range(len(inputs)):
+                level += style_matrix[j, k] * inputs[k]
+            level *= audience_modifiers[audience_ids[i], j]
+            level *= channel_modifiers[channel_ids[i], j]
+            out[i, j] = min(max(level, 0.0), 1.0)
+    return out
+
 
 class StyleSynthesizer:
     """
@@ -54,10 +198,62 @@ class StyleSynthesizer:
         # Audience and channel modifiers
         self._audience_modifiers = self._initialize_audience_modifiers()
         self._channel_modifiers = self._initialize_channel_modifiers()
+        self._channel_sentence_lengths = self._initialize_channel_sentence_lengths()
+        self._audience_decisions = self._initialize_audience_decisions()
         
         # Decoding parameter mappings
         self._decoding_mappings = self._initialize_decoding_mappings()
         
+        # Decoding mappings as the coefficient matrix of the decoding affine map,
+        # one row per decoding parameter
+        mappings = self._decoding_mappings
+        self._decoding_coefficients = np.zeros((5, 5))
+        self._decoding_coefficients[0, 0] = mappings["warmth_to_temp"]
+        self._decoding_coefficients[0, 1] = mappings["humor_to_temp"]
+        self._decoding_coefficients[1, 4] = mappings["assertiveness_to_top_p"]
+        self._decoding_coefficients[3, 2] = mappings["formality_to_penalty"]
+        self._decoding_coefficients[4, 3] = mappings["expansiveness_to_tokens"] * 1000
+        
+        # Trait and state blend folded into one matrix over the synthesis inputs
+        self._style_matrix = (
+            _TRAIT_COEFFICIENTS * self._weights["traits"]
+            + _STATE_COEFFICIENTS * self._weights["state"]
+        )
+        
+        # Single-precision blend and modifier tables for batch synthesis
+        self._batch_style_matrix = self._style_matrix.astype(FLOAT_DTYPE)
+        self._audience_table = self._audience_modifiers.astype(FLOAT_DTYPE)
+        self._channel_table = self._channel_modifiers.astype(FLOAT_DTYPE)
+        
+        # Audience decisions and channel sentence lengths as tables indexed
+        # like the modifier tables, with the neutral choice in the last row
+        self._metaphor_table = np.ones(len(AudienceType) + 1)
+        self._sensitivity_table = np.full(
+            len(AudienceType) + 1, SENSITIVITY_LEVELS.index(SensitivityLevel.NORMAL), dtype=np.uint8
+        )
+        self._nsfw_table = np.zeros(len(AudienceType) + 1, dtype=bool)
+        for audience_type, (metaphor, sensitivity, nsfw) in self._audience_decisions.items():
+            index = _AUDIENCE_INDEX[audience_type]
+            self._metaphor_table[index] = metaphor
+            self._sensitivity_table[index] = SENSITIVITY_LEVELS.index(sensitivity)
+            self._nsfw_table[index] = nsfw
+        self._sentence_length_table = np.zeros(len(ChannelType) + 1, dtype=np.uint8)
+        for channel_type, sentence_len in self._channel_sentence_lengths.items():
+            self._sentence_length_table[_CHANNEL_INDEX[channel_type]] = (
+                SENTENCE_LENGTHS.index(sentence_len)
+            )
+        
+        # Style values and decoding parameters of the last synthesized style,
+        # replaced together so concurrent readers never see a mismatched pair
+        self._last_decoding: Tuple[Optional[Tuple[float, ...]], Optional[Tuple]] = (None, None)
+        
+        # Optional memoization of synthesized styles on quantized inputs
+        self._style_cache = (
+            lru_cache(maxsize=STYLE_CACHE_SIZE)(self._synthesize_quantized)
+            if config.enable_style_cache
+            else None
+        )
+        
         logger.info("Style Synthesizer initialized")
     
     def _initialize_weights(self) -> Dict[str, float]:
@@ -69,99 +265,61 @@ class StyleSynthesizer:
             "channel": 0.1,     # Communication channel
         }
     
-    def _initialize_audience_modifiers(self) -> Dict[str, Dict[str, float]]:
-        """Initialize audience-based style modifiers."""
+    def _initialize_audience_modifiers(self) -> np.ndarray:
+        """
+        Initialize audience-based style modifiers.
+        
+        One row per audience type in enum order plus a neutral last row, each
+        holding multipliers of the style levels in _STYLE_LEVELS order:
+        warmth, formality, humor, flirtation, expansiveness, assertiveness.
+        """
+        modifiers = np.ones((len(AudienceType) + 1, len(_STYLE_LEVELS)))
+        modifiers[_AUDIENCE_INDEX[AudienceType.FRIEND]] = (1.3, 0.6, 1.2, 1.1, 1.0, 1.1)
+        modifiers[_AUDIENCE_INDEX[AudienceType.FAMILY]] = (1.4, 0.5, 1.1, 0.8, 1.0, 1.0)
+        modifiers[_AUDIENCE_INDEX[AudienceType.COLLEAGUE]] = (0.9, 1.2, 0.8, 0.3, 1.0, 1.1)
+        modifiers[_AUDIENCE_INDEX[AudienceType.STRANGER]] = (0.8, 1.1, 0.7, 0.2, 1.0, 0.9)
+        modifiers[_AUDIENCE_INDEX[AudienceType.CHILD]] = (1.5, 0.3, 1.3, 0.1, 1.0, 0.8)
+        modifiers[_AUDIENCE_INDEX[AudienceType.PROFESSIONAL]] = (0.7, 1.4, 0.6, 0.1, 1.0, 1.2)
+        modifiers[_AUDIENCE_INDEX[AudienceType.INTIMATE]] = (1.6, 0.2, 1.0, 1.4, 1.0, 1.0)
+        return modifiers
+    
+    def _initialize_channel_modifiers(self) -> np.ndarray:
+        """
+        Initialize channel-based style modifiers.
+        
+        One row per channel type in enum order plus a neutral last row, laid
+        out like the audience modifiers.
+        """
+        modifiers = np.ones((len(ChannelType) + 1, len(_STYLE_LEVELS)))
+        modifiers[_CHANNEL_INDEX[ChannelType.CHAT]] = (1.0, 0.8, 1.1, 1.0, 0.9, 1.0)
+        modifiers[_CHANNEL_INDEX[ChannelType.EMAIL]] = (0.9, 1.2, 0.8, 1.0, 1.1, 1.0)
+        modifiers[_CHANNEL_INDEX[ChannelType.VOICE]] = (1.2, 0.7, 1.2, 1.0, 1.0, 1.0)
+        modifiers[_CHANNEL_INDEX[ChannelType.VIDEO]] = (1.1, 0.9, 1.0, 1.0, 0.8, 1.0)
+        modifiers[_CHANNEL_INDEX[ChannelType.TEXT]] = (0.8, 1.0, 0.9, 1.0, 0.7, 1.0)
+        return modifiers
+    
+    def _initialize_channel_sentence_lengths(self) -> Dict[ChannelType, SentenceLength]:
+        """Initialize channel-based sentence length overrides."""
         return {
-            "friend": {
-                "warmth": 1.3,
-                "formality": 0.6,
-                "humor": 1.2,
-                "flirtation": 1.1,
-                "assertiveness": 1.1,
-            },
-            "family": {
-                "warmth": 1.4,
-                "formality": 0.5,
-                "humor": 1.1,
-                "flirtation": 0.8,
-                "assertiveness": 1.0,
-            },
-            "colleague": {
-                "warmth": 0.9,
-                "formality": 1.2,
-                "humor": 0.8,
-                "flirtation": 0.3,
-                "assertiveness": 1.1,
-            },
-            "stranger": {
-                "warmth": 0.8,
-                "formality": 1.1,
-                "humor": 0.7,
-                "flirtation": 0.2,
-                "assertiveness": 0.9,
-            },
-            "child": {
-                "warmth": 1.5,
-                "formality": 0.3,
-                "humor": 1.3,
-                "flirtation": 0.1,
-                "assertiveness": 0.8,
-            },
-            "professional": {
-                "warmth": 0.7,
-                "formality": 1.4,
-                "humor": 0.6,
-                "flirtation": 0.1,
-                "assertiveness": 1.2,
-            },
-            "intimate": {
-                "warmth": 1.6,
-                "formality": 0.2,
-                "humor": 1.0,
-                "flirtation": 1.4,
-                "assertiveness": 1.0,
-            },
+            ChannelType.CHAT: SentenceLength.MEDIUM,
+            ChannelType.EMAIL: SentenceLength.LONG,
+            ChannelType.VOICE: SentenceLength.MEDIUM,
+            ChannelType.VIDEO: SentenceLength.SHORT,
+            ChannelType.TEXT: SentenceLength.SHORT,
         }
     
-    def _initialize_channel_modifiers(self) -> Dict[str, Dict[str, float]]:
-        """Initialize channel-based style modifiers."""
-        return {
-            "chat": {
-                "warmth": 1.0,
-                "formality": 0.8,
-                "humor": 1.1,
-                "expansiveness": 0.9,
-                "sentence_len": "medium",
-            },
-            "email": {
-                "warmth": 0.9,
-                "formality": 1.2,
-                "humor": 0.8,
-                "expansiveness": 1.1,
-                "sentence_len": "long",
-            },
-            "voice": {
-                "warmth": 1.2,
-                "formality": 0.7,
-                "humor": 1.2,
-                "expansiveness": 1.0,
-                "sentence_len": "medium",
-            },
-            "video": {
-                "warmth": 1.1,
-                "formality": 0.9,
-                "humor": 1.0,
-                "expansiveness": 0.8,
-                "sentence_len": "short",
-            },
-            "text": {
-                "warmth": 0.8,
-                "formality": 1.0,
-                "humor": 0.9,
-                "expansiveness": 0.7,
-                "sentence_len": "short",
-            },
+    def _initialize_audience_decisions(
+        self
+    ) -> Dict[AudienceType, Tuple[float, SensitivityLevel, bool]]:
+        """Initialize per-audience (metaphor multiplier, sensitivity, nsfw) decisions."""
+        decisions = {
+            audience_type: (1.0, SensitivityLevel.NORMAL, False)
+            for audience_type in AudienceType
         }
+        decisions[AudienceType.CHILD] = (1.2, SensitivityLevel.SOFTEN, False)  # More metaphors, softened
+        decisions[AudienceType.PROFESSIONAL] = (0.7, SensitivityLevel.NORMAL, False)  # Fewer metaphors
+        decisions[AudienceType.INTIMATE] = (1.0, SensitivityLevel.NORMAL, True)
+        return decisions
     
     def _initialize_decoding_mappings(self) -> Dict[str, Dict[str, float]]:
         """Initialize mappings from style to LLM decoding parameters."""
@@ -194,102 +352,307 @@ class StyleSynthesizer:
         Returns:
             Synthesized style profile
         """
+        if self._style_cache is not None:
+            return self._synthesize_cached(traits, state, audience, channel, boundaries)
+        return self._synthesize_style(traits, state, audience, channel, boundaries)
+    
+    def _synthesize_style(
+        self,
+        traits: TraitKernel,
+        state: AffectiveState,
+        audience: Optional[AudienceContext] = None,
+        channel: Optional[ChannelContext] = None,
+        boundaries: Optional[BoundaryCaps] = None
+    ) -> StyleProfile:
+        """Synthesize a style profile without the cache."""
         logger.debug("Synthesizing style profile")
         
-        # Generate base tone from traits and state
-        base_tone = self._synthesize_tone(traits, state, audience, channel)
-        
-        # Generate diction profile
-        diction = self._synthesize_diction(traits, state, audience, channel)
-        
-        # Generate pacing profile
-        pacing = self._synthesize_pacing(traits, state, audience, channel)
-        
-        # Generate stance profile
-        stance = self._synthesize_stance(traits, state, audience, channel)
+        # Generate tone, pacing and stance levels in one blend
+        warmth, formality, humor, flirtation, expansiveness, assertiveness = (
+            self._synthesize_levels(traits, state, audience, channel).tolist()
+        )
         
-        # Generate boundary profile
-        boundary_profile = self._synthesize_boundaries(boundaries, audience, channel)
+        # Generate decoding profile from the levels before boundary caps
+        decoding = self._synthesize_decoding(
+            warmth, humor, formality, expansiveness, assertiveness
+        )
         
-        # Generate decoding profile
-        decoding = self._synthesize_decoding(base_tone, pacing, stance)
+        # Apply boundary constraints while building the tone
+        if boundaries:
+            formality = max(formality, boundaries.min_formality)
+            humor = min(humor, boundaries.max_humor)
+            flirtation = min(flirtation, boundaries.max_flirtation)
         
         # Create complete style profile
         style = StyleProfile(
-            tone=base_tone,
-            diction=diction,
-            pacing=pacing,
-            stance=stance,
-            boundaries=boundary_profile,
+            tone=ToneProfile(
+                warmth=warmth,
+                formality=formality,
+                humor=humor,
+                flirtation=flirtation,
+            ),
+            diction=self._synthesize_diction(traits, state, audience, channel),
+            pacing=PacingProfile(expansiveness=expansiveness),
+            stance=StanceProfile(assertiveness=assertiveness),
+            boundaries=self._synthesize_boundaries(boundaries, audience, channel),
             decoding=decoding,
         )
         
-        # Apply boundary constraints
-        style = self._apply_boundary_constraints(style, boundaries)
-        
         logger.debug("Style synthesis complete: warmth=%.2f, formality=%.2f, humor=%.2f",
                     style.tone.warmth, style.tone.formality, style.tone.humor)
         
         return style
     
-    def _synthesize_tone(
+    def _synthesize_cached(
+        self,
+        traits: TraitKernel,
+        state: AffectiveState,
+        audience: Optional[AudienceContext] = None,
+        channel: Optional[ChannelContext] = None,
+        boundaries: Optional[BoundaryCaps] = None
+    ) -> StyleProfile:
+        """
+        Synthesize a style profile through the quantized-input cache.
+        
+        Traits and state are quantized to 16 levels and packed 4 bits per
+        value into integer keys. Boundary caps are safety limits, so they
+        are keyed exactly. Each call returns a new profile built from the
+        cached values, so callers may modify it.
+        """
+        trait_key = (
+            _quantize(traits.curiosity)
+            | _quantize(traits.balance) << 4
+            | _quantize(traits.wit) << 8
+            | _quantize(traits.candor) << 12
+            | _quantize(traits.care) << 16
+        )
+        state_key = (
+            _quantize((state.valence + 1.0) / 2.0)
+            | _quantize(state.arousal) << 4
+            | _quantize(state.fatigue) << 8
+        )
+        boundary_key = None
+        if boundaries:
+            boundary_key = (
+                boundaries.max_flirtation,
+                boundaries.max_humor,
+                boundaries.min_formality,
+            )
+        
+        style = self._style_cache(
+            trait_key,
+            state_key,
+            audience.type if audience else None,
+            channel.type if channel else None,
+            boundary_key,
+        )
+        return StyleProfile.model_validate(style)
+    
+    def _synthesize_quantized(
+        self,
+        trait_key: int,
+        state_key: int,
+        audience_type: Optional[AudienceType],
+        channel_type: Optional[ChannelType],
+        boundary_key: Optional[Tuple[float, float, float]]
+    ) -> Dict[str, Any]:
+        """Synthesize the style of quantized inputs as a plain dict for the cache."""
+        traits = TraitKernel(
+            curiosity=_dequantize(trait_key, 0),
+            balance=_dequantize(trait_key, 4),
+            wit=_dequantize(trait_key, 8),
+            candor=_dequantize(trait_key, 12),
+            care=_dequantize(trait_key, 16),
+        )
+        state = AffectiveState(
+            valence=_dequantize(state_key, 0) * 2.0 - 1.0,
+            arousal=_dequantize(state_key, 4),
+            fatigue=_dequantize(state_key, 8),
+            decay=1.0,
+        )
+        audience = AudienceContext(type=audience_type) if audience_type else None
+        channel = ChannelContext(type=channel_type) if channel_type else None
+        boundaries = None
+        if boundary_key:
+            max_flirtation, max_humor, min_formality = boundary_key
+            boundaries = BoundaryCaps(
+                max_flirtation=max_flirtation,
+                max_humor=max_humor,
+                max_candor=1.0,
+                min_formality=min_formality,
+            )
+        
+        return self._synthesize_style(traits, state, audience, channel, boundaries).model_dump()
+    
+    def _synthesize_levels(
         self,
         traits: TraitKernel,
         state: AffectiveState,
         audience: Optional[AudienceContext] = None,
         channel: Optional[ChannelContext] = None
-    ) -> ToneProfile:
-        """Synthesize tone characteristics."""
-        # Base tone from traits
-        base_warmth = traits.care * 0.8 + traits.balance * 0.2
-        base_formality = 1.0 - traits.candor * 0.6 - traits.wit * 0.4
-        base_humor = traits.wit * 0.8 + traits.curiosity * 0.2
-        base_flirtation = traits.candor * 0.4 + traits.wit * 0.3
+    ) -> np.ndarray:
+        """
+        Synthesize the tone, pacing and stance levels.
         
-        # State influence
-        state_warmth = (state.valence + 1.0) / 2.0  # Map valence to warmth
-        state_formality = 1.0 - state.arousal * 0.3  # Higher arousal = less formal
-        state_humor = (state.valence + 1.0) / 2.0 * (1.0 - state.fatigue * 0.5)
-        state_flirtation = (state.valence + 1.0) / 2.0 * (1.0 - state.fatigue * 0.3)
-        
-        # Blend components
-        weights = self._weights
-        warmth = (base_warmth * weights["traits"] + 
-                 state_warmth * weights["state"])
-        formality = (base_formality * weights["traits"] + 
-                    state_formality * weights["state"])
-        humor = (base_humor * weights["traits"] + 
-                state_humor * weights["state"])
-        flirtation = (base_flirtation * weights["traits"] + 
-                     state_flirtation * weights["state"])
-        
-        # Apply audience modifiers
-        if audience:
-            audience_mod = self._audience_modifiers.get(audience.type.value, {})
-            warmth *= audience_mod.get("warmth", 1.0)
-            formality *= audience_mod.get("formality", 1.0)
-            humor *= audience_mod.get("humor", 1.0)
-            flirtation *= audience_mod.get("flirtation", 1.0)
+        Traits and state are blended with a single matrix product, then
+        scaled by the audience and channel modifiers and clamped once.
         
-        # Apply channel modifiers
+        Returns:
+            Array of levels in _STYLE_LEVELS order
+        """
+        valence = (state.valence + 1.0) / 2.0
+        inputs = np.array([
+            traits.care,
+            traits.balance,
+            traits.candor,
+            traits.wit,
+            traits.curiosity,
+            valence,
+            state.arousal,
+            state.fatigue,
+            valence * state.fatigue,
+            1.0,
+        ])
+        levels = self._style_matrix @ inputs
+        
+        # Apply audience and channel modifiers
+        if audience:
+            levels *= self._audience_modifiers[_AUDIENCE_INDEX[audience.type]]
         if channel:
-            channel_mod = self._channel_modifiers.get(channel.type.value, {})
-            warmth *= channel_mod.get("warmth", 1.0)
-            formality *= channel_mod.get("formality", 1.0)
-            humor *= channel_mod.get("humor", 1.0)
-        
-        # Clamp values
-        warmth = np.clip(warmth, 0.0, 1.0)
-        formality = np.clip(formality, 0.0, 1.0)
-        humor = np.clip(humor, 0.0, 1.0)
-        flirtation = np.clip(flirtation, 0.0, 1.0)
-        
-        return ToneProfile(
-            warmth=warmth,
-            formality=formality,
-            humor=humor,
-            flirtation=flirtation,
+            levels *= self._channel_modifiers[_CHANNEL_INDEX[channel.type]]
+        
+        return np.clip(levels, 0.0, 1.0, out=levels)
+    
+    def synthesize_style_batch(
+        self,
+        traits: np.ndarray,
+        states: np.ndarray,
+        audience_ids: np.ndarray,
+        channel_ids: np.ndarray
+    ) -> np.ndarray:
+        """
+        Synthesize the tone, pacing and stance levels of many inputs at once.
+        
+        Applies the same blend, modifiers and clamp as :meth:`synthesize_style`
+        to every row. Index arrays for lists of contexts can be built with
+        :meth:`encode_contexts`.
+        
+        Args:
+            traits: (N, 5) array of (curiosity, balance, wit, candor, care) rows
+            states: (N, 3) array of (valence, arousal, fatigue) rows
+            audience_ids: (N,) audience type table indices
+            channel_ids: (N,) channel type table indices
+            
+        Returns:
+            (N, 6) float32 array of levels in _STYLE_LEVELS order
+        """
+        traits = np.asarray(traits, dtype=FLOAT_DTYPE)
+        states = np.asarray(states, dtype=FLOAT_DTYPE)
+        out = np.empty((len(traits), len(_STYLE_LEVELS)), dtype=FLOAT_DTYPE)
+        return _synthesize_levels_kernel(
+            traits,
+            states,
+            np.asarray(audience_ids, dtype=np.intp),
+            np.asarray(channel_ids, dtype=np.intp),
+            self._batch_style_matrix,
+            self._audience_table,
+            self._channel_table,
+            out,
+        )
+    
+    def synthesize_profile_batch(
+        self,
+        traits: np.ndarray,
+        states: np.ndarray,
+        audience_ids: np.ndarray,
+        channel_ids: np.ndarray,
+        boundaries: Optional[BoundaryCaps] = None
+    ) -> StyleProfileBatch:
+        """
+        Synthesize complete style profiles of many inputs at once.
+        
+        Fills every column of a new batch in one pass over the inputs: the
+        style levels come from the fused blend kernel, diction and boundary
+        choices from table lookups, and decoding from the affine map, so the
+        rows match :meth:`synthesize_style` without building any models.
+        
+        Args:
+            traits: (N, 5) array of (curiosity, balance, wit, candor, care) rows
+            states: (N, 3) array of (valence, arousal, fatigue) rows
+            audience_ids: (N,) audience type table indices
+            channel_ids: (N,) channel type table indices
+            boundaries: Boundary constraints applied to every row
+            
+        Returns:
+            Batch of synthesized style profiles
+        """
+        traits = np.asarray(traits, dtype=FLOAT_DTYPE)
+        states = np.asarray(states, dtype=FLOAT_DTYPE)
+        audience_ids = np.asarray(audience_ids, dtype=np.intp)
+        channel_ids = np.asarray(channel_ids, dtype=np.intp)
+        
+        batch = StyleProfileBatch(len(traits))
+        levels = self.synthesize_style_batch(traits, states, audience_ids, channel_ids)
+        batch.warmth[:] = levels[:, 0]
+        batch.formality[:] = levels[:, 1]
+        batch.humor[:] = levels[:, 2]
+        batch.flirtation[:] = levels[:, 3]
+        batch.expansiveness[:] = levels[:, 4]
+        batch.assertiveness[:] = levels[:, 5]
+        
+        # Diction: channel sentence lengths override the trait and state rules
+        batch.sentence_len[:] = np.where(
+            channel_ids == _NO_CHANNEL,
+            _sentence_length_codes(traits, states),
+            self._sentence_length_table[channel_ids],
+        )
+        metaphor = traits[:, 2] * 0.6 + traits[:, 0] * 0.4
+        metaphor *= 1.0 - states[:, 2] * 0.3
+        metaphor *= self._metaphor_table[audience_ids]
+        np.clip(metaphor, 0.0, 1.0, out=batch.metaphor)
+        
+        batch.nsfw[:] = self._nsfw_table[audience_ids]
+        batch.sensitive[:] = self._sensitivity_table[audience_ids]
+        
+        # Decoding follows the levels before boundary caps
+        self.synthesize_decoding_batch(batch)
+        if boundaries:
+            batch.apply_boundaries(boundaries)
+        
+        return batch
+    
+    def encode_contexts(
+        self,
+        audiences: Sequence[Optional[AudienceContext]],
+        channels: Sequence[Optional[ChannelContext]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode audience and channel contexts for :meth:`synthesize_style_batch`.
+        
+        Args:
+            audiences: Audience context of each row (None for no audience)
+            channels: Channel context of each row (None for no channel)
+            
+        Returns:
+            Tuple of (audience_ids, channel_ids)
+        """
+        audience_ids = np.fromiter(
+            (
+                _AUDIENCE_INDEX[audience.type] if audience else _NO_AUDIENCE
+                for audience in audiences
+            ),
+            dtype=np.intp,
+            count=len(audiences),
+        )
+        channel_ids = np.fromiter(
+            (
+                _CHANNEL_INDEX[channel.type] if channel else _NO_CHANNEL
+                for channel in channels
+            ),
+            dtype=np.intp,
+            count=len(channels),
         )
+        return audience_ids, channel_ids
     
     def _synthesize_diction(
         self,
@@ -309,9 +672,7 @@ class StyleSynthesizer:
         
         # Channel override
         if channel:
-            channel_mod = self._channel_modifiers.get(channel.type.value, {})
-            if "sentence_len" in channel_mod:
-                sentence_len = SentenceLength(channel_mod["sentence_len"])
+            sentence_len = self._channel_sentence_lengths[channel.type]
         
         # Metaphor density from traits
         metaphor_density = traits.wit * 0.6 + traits.curiosity * 0.4
@@ -320,72 +681,16 @@ class StyleSynthesizer:
         metaphor_density *= (1.0 - state.fatigue * 0.3)  # Less metaphors when tired
         
         # Audience influence
-        if audience and audience.type.value == "child":
-            metaphor_density *= 1.2  # More metaphors for children
-        elif audience and audience.type.value == "professional":
-            metaphor_density *= 0.7  # Fewer metaphors in professional context
+        if audience:
+            metaphor_density *= self._audience_decisions[audience.type][0]
         
-        metaphor_density = np.clip(metaphor_density, 0.0, 1.0)
+        metaphor_density = _clip(metaphor_density, 0.0, 1.0)
         
         return DictionProfile(
             sentence_len=sentence_len,
             metaphor=metaphor_density,
         )
     
-    def _synthesize_pacing(
-        self,
-        traits: TraitKernel,
-        state: AffectiveState,
-        audience: Optional[AudienceContext] = None,
-        channel: Optional[ChannelContext] = None
-    ) -> PacingProfile:
-        """Synthesize pacing characteristics."""
-        # Base expansiveness from traits
-        base_expansiveness = traits.curiosity * 0.7 + traits.candor * 0.3
-        
-        # State influence
-        state_expansiveness = (state.arousal * 0.6 + (1.0 - state.fatigue) * 0.4)
-        
-        # Blend
-        expansiveness = (base_expansiveness * self._weights["traits"] + 
-                        state_expansiveness * self._weights["state"])
-        
-        # Channel influence
-        if channel:
-            channel_mod = self._channel_modifiers.get(channel.type.value, {})
-            expansiveness *= channel_mod.get("expansiveness", 1.0)
-        
-        expansiveness = np.clip(expansiveness, 0.0, 1.0)
-        
-        return PacingProfile(expansiveness=expansiveness)
-    
-    def _synthesize_stance(
-        self,
-        traits: TraitKernel,
-        state: AffectiveState,
-        audience: Optional[AudienceContext] = None,
-        channel: Optional[ChannelContext] = None
-    ) -> StanceProfile:
-        """Synthesize stance characteristics."""
-        # Base assertiveness from traits
-        base_assertiveness = traits.candor * 0.8 + traits.balance * 0.2
-        
-        # State influence
-        state_assertiveness = (state.arousal * 0.5 + (state.valence + 1.0) / 2.0 * 0.5)
-        
-        # Blend
-        assertiveness = (base_assertiveness * self._weights["traits"] + 
-                        state_assertiveness * self._weights["state"])
-        
-        # Audience influence
-        if audience:
-            audience_mod = self._audience_modifiers.get(audience.type.value, {})
-            assertiveness *= audience_mod.get("assertiveness", 1.0)
-        
-        assertiveness = np.clip(assertiveness, 0.0, 1.0)
-        
-        return StanceProfile(assertiveness=assertiveness)
-    
     def _synthesize_boundaries(
         self,
         boundaries: Optional[BoundaryCaps] = None,
@@ -405,20 +710,10 @@ class StyleSynthesizer:
             max_candor = 0.9
             min_formality = 0.2
         
-        # Determine sensitivity level
-        sensitivity = "normal"
+        # Determine sensitivity level and NSFW setting
+        sensitivity, nsfw = SensitivityLevel.NORMAL, False
         if audience:
-            if audience.type.value == "child":
-                sensitivity = "soften"
-            elif audience.type.value == "professional":
-                sensitivity = "normal"
-            elif audience.type.value == "intimate":
-                sensitivity = "normal"
-        
-        # NSFW setting
-        nsfw = False
-        if audience and audience.type.value == "intimate":
-            nsfw = True
+            _, sensitivity, nsfw = self._audience_decisions[audience.type]
         
         return BoundaryProfile(
             nsfw=nsfw,
@@ -427,11 +722,42 @@ class StyleSynthesizer:
     
     def _synthesize_decoding(
         self,
-        tone: ToneProfile,
-        pacing: PacingProfile,
-        stance: StanceProfile
+        warmth: float,
+        humor: float,
+        formality: float,
+        expansiveness: float,
+        assertiveness: float
     ) -> DecodingProfile:
-        """Synthesize LLM decoding parameters from style."""
+        """
+        Synthesize LLM decoding parameters from style.
+        
+        The parameters of the last style are remembered, so a repeated style
+        skips the mapping arithmetic. A new profile is returned either way.
+        """
+        key = (warmth, humor, formality, expansiveness, assertiveness)
+        last_key, params = self._last_decoding
+        if key != last_key:
+            params = self._calculate_decoding(*key)
+            self._last_decoding = (key, params)
+        
+        temp, top_p, top_k, penalty, max_tokens = params
+        return DecodingProfile(
+            temp=temp,
+            top_p=top_p,
+            top_k=top_k,
+            penalty=penalty,
+            max_tokens=max_tokens,
+        )
+    
+    def _calculate_decoding(
+        self,
+        warmth: float,
+        humor: float,
+        formality: float,
+        expansiveness: float,
+        assertiveness: float
+    ) -> Tuple[float, float, int, float, int]:
+        """Calculate (temp, top_p, top_k, penalty, max_tokens) from style."""
         # Base parameters
         temp = 0.7
         top_p = 0.9
@@ -443,55 +769,56 @@ class StyleSynthesizer:
         mappings = self._decoding_mappings
         
         # Temperature adjustments
-        temp += tone.warmth * mappings["warmth_to_temp"]
-        temp += tone.humor * mappings["humor_to_temp"]
+        temp += warmth * mappings["warmth_to_temp"]
+        temp += humor * mappings["humor_to_temp"]
         
         # Penalty adjustments
-        penalty += tone.formality * mappings["formality_to_penalty"]
+        penalty += formality * mappings["formality_to_penalty"]
         
         # Token adjustments
-        max_tokens += int(pacing.expansiveness * mappings["expansiveness_to_tokens"] * 1000)
+        max_tokens += int(expansiveness * mappings["expansiveness_to_tokens"] * 1000)
         
         # Top-p adjustments
-        top_p += stance.assertiveness * mappings["assertiveness_to_top_p"]
+        top_p += assertiveness * mappings["assertiveness_to_top_p"]
         
         # Clamp to safe ranges
-        temp = np.clip(temp, 0.1, 2.0)
-        top_p = np.clip(top_p, 0.1, 1.0)
-        top_k = np.clip(top_k, 1, 100)
-        penalty = np.clip(penalty, 0.1, 2.0)
-        max_tokens = np.clip(max_tokens, 100, 4000)
+        temp = _clip(temp, 0.1, 2.0)
+        top_p = _clip(top_p, 0.1, 1.0)
+        top_k = _clip(top_k, 1, 100)
+        penalty = _clip(penalty, 0.1, 2.0)
+        max_tokens = _clip(max_tokens, 100, 4000)
         
-        return DecodingProfile(
-            temp=temp,
-            top_p=top_p,
-            top_k=top_k,
-            penalty=penalty,
-            max_tokens=max_tokens,
-        )
+        return temp, top_p, top_k, penalty, max_tokens
     
-    def _apply_boundary_constraints(
-        self,
-        style: StyleProfile,
-        boundaries: Optional[BoundaryCaps] = None
-    ) -> StyleProfile:
-        """Apply boundary constraints to the style profile."""
-        if not boundaries:
-            return style
+    def synthesize_decoding_batch(self, batch: StyleProfileBatch) -> StyleProfileBatch:
+        """
+        Fill the decoding columns of a batch from its tone, pacing and stance.
         
-        # Apply flirtation cap
-        if style.tone.flirtation > boundaries.max_flirtation:
-            style.tone.flirtation = boundaries.max_flirtation
+        Applies the same mappings and clamps as the per-profile decoding
+        synthesis to every row, as one affine map over the style columns.
         
-        # Apply humor cap
-        if style.tone.humor > boundaries.max_humor:
-            style.tone.humor = boundaries.max_humor
+        Args:
+            batch: Style profile batch with tone, pacing and stance filled in
+            
+        Returns:
+            The same batch, with decoding columns filled in
+        """
+        # One affine map and clamp over all rows, computed in double precision
+        # so truncated token counts are not shifted by rounding
+        style = np.column_stack(
+            (batch.warmth, batch.humor, batch.formality, batch.expansiveness, batch.assertiveness)
+        )
+        params = style @ self._decoding_coefficients.T
+        params += _DECODING_BASE
+        np.clip(params, _DECODING_LO, _DECODING_HI, out=params)
         
-        # Apply formality minimum
-        if style.tone.formality < boundaries.min_formality:
-            style.tone.formality = boundaries.min_formality
+        batch.temp[:] = params[:, 0]
+        batch.top_p[:] = params[:, 1]
+        batch.top_k[:] = params[:, 2]
+        batch.penalty[:] = params[:, 3]
+        batch.max_tokens[:] = params[:, 4]
         
-        return style
+        return batch
     
     def get_style_compatibility_score(
         self,
@@ -509,10 +836,11 @@ class StyleSynthesizer:
             Compatibility score between 0 and 1 (higher = more compatible)
         """
         # Calculate differences in key dimensions
+        tone1, tone2 = style1.tone, style2.tone
         tone_diff = (
-            abs(style1.tone.warmth - style2.tone.warmth) +
-            abs(style1.tone.formality - style2.tone.formality) +
-            abs(style1.tone.humor - style2.tone.humor)
+            abs(tone1.warmth - tone2.warmth) +
+            abs(tone1.formality - tone2.formality) +
+            abs(tone1.humor - tone2.humor)
         ) / 3.0
         
         stance_diff = abs(style1.stance.assertiveness - style2.stance.assertiveness)
@@ -525,4 +853,29 @@ class StyleSynthesizer:
         # Convert to compatibility score (1 - difference)
         compatibility = max(0.0, 1.0 - total_diff)
         
-        return compatibility
\ No newline at end of file
+        return compatibility
+    
+    @staticmethod
+    def compatibility_matrix(styles1: np.ndarray, styles2: np.ndarray) -> np.ndarray:
+        """
+        Calculate pairwise compatibility scores between two sets of styles.
+        
+        Uses the same weighting as :meth:`get_style_compatibility_score`.
+        Rows for a batch of profiles are given by
+        :meth:`StyleProfileBatch.compatibility_features`.
+        
+        Args:
+            styles1: (N, 5) array of (warmth, formality, humor, assertiveness,
+                expansiveness) rows
+            styles2: (M, 5) array in the same layout
+            
+        Returns:
+            (N, M) float32 array of compatibility scores between 0 and 1
+        """
+        styles1 = np.asarray(styles1, dtype=FLOAT_DTYPE)
+        styles2 = np.asarray(styles2, dtype=FLOAT_DTYPE)
+        
+        diffs = np.abs(styles1[:, None, :] - styles2[None, :, :])
+        total_diff = diffs @ _COMPATIBILITY_WEIGHTS
+        
+        return np.clip(1.0 - total_diff, 0.0, 1.0, out=total_diff)
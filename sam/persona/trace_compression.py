@@ -0,0 +1,196 @@
+"""
+Compressed storage for aged style traces.
+
+This module rolls older style traces into per-hour chunks that keep only
+what the style analytics need: trace timestamps, encoded as delta-of-delta
+integers, and the numeric style deltas, encoded with a Gorilla-style
+XOR-and-zero-byte scheme.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .models import StyleTrace
+
+
+# Style dimensions retained for compressed traces
+STYLE_DIMENSIONS = ("warmth", "formality", "humor", "assertiveness")
+
+MS_PER_HOUR = 3_600_000
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def to_epoch_ms(ts: datetime) -> int:
+    """Convert a naive UTC timestamp to integer milliseconds since the epoch."""
+    return (ts - _EPOCH) // _ONE_MS
+
+
+def parse_delta(delta: str) -> Optional[float]:
+    """Parse a signed style delta string such as "+0.05" into a float."""
+    try:
+        return float(delta)
+    except (TypeError, ValueError):
+        return None
+
+
+def encode_floats(values: np.ndarray) -> bytes:
+    """
+    Encode float64 values by XOR-ing each with its predecessor.
+
+    Every value is written as a header byte holding the number of leading
+    (high nibble) and trailing (low nibble) zero bytes of the XOR, followed
+    by the remaining meaningful bytes. Repeated values cost a single byte.
+
+    Args:
+        values: Float values to encode
+
+    Returns:
+        Encoded byte string
+    """
+    out = bytearray()
+    prev = 0
+    for bits in np.asarray(values, dtype=np.float64).view(np.uint64).tolist():
+        xor = bits ^ prev
+        prev = bits
+        if xor == 0:
+            out.append(0x80)
+            continue
+        raw = xor.to_bytes(8, "big")
+        lead = 8 - len(raw.lstrip(b"\x00"))
+        trail = 8 - len(raw.rstrip(b"\x00"))
+        out.append((lead << 4) | trail)
+        out += raw[lead:8 - trail]
+    return bytes(out)
+
+
+def decode_floats(data: bytes, count: int) -> np.ndarray:
+    """
+    Decode values produced by :func:`encode_floats`.
+
+    Args:
+        data: Encoded byte string
+        count: Number of encoded values
+
+    Returns:
+        Decoded float64 values
+    """
+    bits = np.empty(count, dtype=np.uint64)
+    prev = 0
+    pos = 0
+    for i in range(count):
+        header = data[pos]
+        pos += 1
+        lead, trail = header >> 4, header & 0x0F
+        width = 8 - lead - trail
+        if width > 0:
+            prev ^= int.from_bytes(data[pos:pos + width], "big") << (8 * trail)
+            pos += width
+        bits[i] = prev
+    return bits.view(np.float64)
+
+
+class TraceChunk:
+    """
+    Compressed run of style traces falling within a single hour.
+
+    Only timestamps, the presence of a style change, and the numeric deltas
+    of :data:`STYLE_DIMENSIONS` are kept; missing or unparseable deltas are
+    stored as NaN.
+    """
+
+    __slots__ = ("start_ms", "end_ms", "count", "ts_delta", "_changed", "_delta_xor")
+
+    def __init__(
+        self,
+        start_ms: int,
+        end_ms: int,
+        count: int,
+        ts_delta: np.ndarray,
+        changed: np.ndarray,
+        delta_xor: Dict[str, bytes],
+    ):
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+        self.count = count
+        self.ts_delta = ts_delta
+        self._changed = changed
+        self._delta_xor = delta_xor
+
+    @classmethod
+    def from_traces(cls, traces: Sequence[StyleTrace]) -> "TraceChunk":
+        """
+        Compress a time-ordered sequence of traces.
+
+        Args:
+            traces: Traces to compress, oldest first
+
+        Returns:
+            Compressed trace chunk
+        """
+        ts_ms = np.fromiter(
+            (to_epoch_ms(trace.ts) for trace in traces), dtype=np.int64, count=len(traces)
+        )
+        deltas = np.diff(ts_ms, prepend=ts_ms[0])
+        ts_delta = np.diff(deltas, prepend=0).astype(np.int32)
+
+        changed = np.fromiter(
+            (bool(trace.style_delta) for trace in traces), dtype=bool, count=len(traces)
+        )
+
+        delta_xor = {}
+        for dimension in STYLE_DIMENSIONS:
+            values = np.full(len(traces), np.nan)
+            for i, trace in enumerate(traces):
+                value = parse_delta(trace.style_delta.get(dimension))
+                if value is not None:
+                    values[i] = value
+            delta_xor[dimension] = encode_floats(values)
+
+        return cls(
+            start_ms=int(ts_ms[0]),
+            end_ms=int(ts_ms[-1]),
+            count=len(traces),
+            ts_delta=ts_delta,
+            changed=np.packbits(changed),
+            delta_xor=delta_xor,
+        )
+
+    def timestamps_ms(self) -> np.ndarray:
+        """Decode the trace timestamps in epoch milliseconds."""
+        return self.start_ms + np.cumsum(np.cumsum(self.ts_delta, dtype=np.int64))
+
+    def changed_mask(self) -> np.ndarray:
+        """Decode which traces carried a style change."""
+        return np.unpackbits(self._changed, count=self.count).astype(bool)
+
+    def decode_dimension(self, dimension: str) -> np.ndarray:
+        """Decode the style deltas for one dimension (NaN where missing)."""
+        return decode_floats(self._delta_xor[dimension], self.count)
+
+
+def compress_by_hour(traces: Sequence[StyleTrace]) -> List[TraceChunk]:
+    """
+    Split time-ordered traces into one compressed chunk per hour.
+
+    Args:
+        traces: Traces to compress, oldest first
+
+    Returns:
+        Compressed chunks, oldest first
+    """
+    chunks = []
+    start = 0
+    current_hour = None
+    for i, trace in enumerate(traces):
+        hour = to_epoch_ms(trace.ts) // MS_PER_HOUR
+        if current_hour is not None and hour != current_hour:
+            chunks.append(TraceChunk.from_traces(traces[start:i]))
+            start = i
+        current_hour = hour
+    if start < len(traces):
+        chunks.append(TraceChunk.from_traces(traces[start:]))
+    return chunks
@@ -57,6 +57,10 @@ setup(
             "fastapi>=0.100.0",
             "uvicorn>=0.22.0",
             "pydantic>=2.0.0",
+            "orjson>=3.9.0",
+        ],
+        "jit": [
+            "numba>=0.57.0",
         ],
     },
     entry_points={
@@ -11,7 +11,9 @@ from datetime import datetime
 
 from sam.persona.core import PersonalityMatrix
 from sam.persona.models import (
+    BoundaryCaps,
     PersonalityConfig,
+    TraitKernel,
     StateUpdate,
     EventType,
     AudienceContext,
@@ -24,10 +26,17 @@ from sam.persona.models import (
 class TestPersonalityMatrix:
     """Test cases for the PersonalityMatrix class."""
     
-    @pytest.fixture
-    def config(self):
-        """Create a test configuration."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
+        """Create a test configuration shared by the class; no test modifies it."""
         return PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.85, balance=0.9, wit=0.7, candor=0.8, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
             state_decay_rate=0.9,
             valence_setpoint=0.5,
             arousal_setpoint=0.4,
@@ -53,52 +62,37 @@ class TestPersonalityMatrix:
         """Test getting the trait kernel."""
         traits = pmx.get_traits()
         assert traits is not None
-        assert hasattr(traits, 'curiosity')
-        assert hasattr(traits, 'balance')
-        assert hasattr(traits, 'wit')
-        assert hasattr(traits, 'candor')
-        assert hasattr(traits, 'care')
+        assert {"curiosity", "balance", "wit", "candor", "care"} <= set(type(traits).model_fields)
     
     def test_get_current_state(self, pmx):
         """Test getting the current affective state."""
         state = pmx.get_current_state()
         assert state is not None
-        assert hasattr(state, 'valence')
-        assert hasattr(state, 'arousal')
-        assert hasattr(state, 'fatigue')
-        assert hasattr(state, 'tags')
-        assert hasattr(state, 'decay')
+        assert {"valence", "arousal", "fatigue", "tags", "decay"} <= set(type(state).model_fields)
     
     def test_get_style_profile(self, pmx):
         """Test getting the current style profile."""
         style = pmx.get_style_profile()
         assert style is not None
-        assert hasattr(style, 'tone')
-        assert hasattr(style, 'diction')
-        assert hasattr(style, 'pacing')
-        assert hasattr(style, 'stance')
-        assert hasattr(style, 'boundaries')
-        assert hasattr(style, 'decoding')
+        assert {
+            "tone", "diction", "pacing", "stance", "boundaries", "decoding",
+        } <= set(type(style).model_fields)
     
     def test_get_boundary_caps(self, pmx):
         """Test getting the current boundary caps."""
         boundaries = pmx.get_boundary_caps()
         assert boundaries is not None
-        assert hasattr(boundaries, 'max_flirtation')
-        assert hasattr(boundaries, 'max_humor')
-        assert hasattr(boundaries, 'max_candor')
-        assert hasattr(boundaries, 'min_formality')
-        assert hasattr(boundaries, 'safety_tags')
+        assert {
+            "max_flirtation", "max_humor", "max_candor", "min_formality", "safety_tags",
+        } <= set(type(boundaries).model_fields)
     
     def test_get_decoding_profile(self, pmx):
         """Test getting the current decoding profile."""
         decoding = pmx.get_decoding_profile()
         assert decoding is not None
-        assert hasattr(decoding, 'temp')
-        assert hasattr(decoding, 'top_p')
-        assert hasattr(decoding, 'top_k')
-        assert hasattr(decoding, 'penalty')
-        assert hasattr(decoding, 'max_tokens')
+        assert {
+            "temp", "top_p", "top_k", "penalty", "max_tokens",
+        } <= set(type(decoding).model_fields)
     
     @pytest.mark.asyncio
     async def test_update_state_positive_interaction(self, pmx):
@@ -254,6 +248,28 @@ class TestPersonalityMatrix:
         assert "boundaries" in summary
         assert "llm_settings" in summary
     
+    @pytest.mark.asyncio
+    async def test_personality_summary_cache(self, pmx):
+        """Test that the cached summary is protected and refreshed on changes."""
+        summary = pmx.get_personality_summary()
+        summary["traits"]["care"] = 0.0
+        summary["current_mood"]["tags"].append("mutated")
+        
+        summary = pmx.get_personality_summary()
+        assert summary["traits"]["care"] == pmx.traits.care
+        assert "mutated" not in summary["current_mood"]["tags"]
+        
+        await pmx.update_state(
+            StateUpdate(event_type=EventType.POSITIVE_INTERACTION, intensity=0.8)
+        )
+        summary = pmx.get_personality_summary()
+        assert summary["current_mood"]["valence"] == pmx.get_current_state().valence
+        
+        export_data = pmx.export_personality()
+        export_data["current_state"]["valence"] = -0.3
+        pmx.import_personality(export_data)
+        assert pmx.get_personality_summary()["current_mood"]["valence"] == -0.3
+    
     @pytest.mark.asyncio
     async def test_drift_detection(self, pmx):
         """Test personality drift detection."""
@@ -272,6 +288,49 @@ class TestPersonalityMatrix:
             # The trace should contain information about the change
             assert traces[0].style_delta is not None
     
+    @pytest.mark.asyncio
+    async def test_drift_correction_uses_previous_state(self):
+        """Test that drift corrections pull toward the style of the previous state."""
+        pmx = PersonalityMatrix(PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.85, balance=0.9, wit=0.7, candor=0.8, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
+            state_decay_rate=0.9,
+            valence_setpoint=0.5,
+            arousal_setpoint=0.4,
+            drift_threshold=0.01,
+        ))
+        
+        update = StateUpdate(event_type=EventType.NEGATIVE_INTERACTION, intensity=0.7)
+        style = await pmx.update_state(update)
+        
+        assert style.tone.warmth == pytest.approx(0.521815)
+        assert style.tone.formality == pytest.approx(0.388)
+        assert style.tone.humor == pytest.approx(0.481570816)
+        assert style.stance.assertiveness == pytest.approx(0.49445725)
+    
+    def test_non_string_emotional_state(self, pmx):
+        """Test that a non-string emotional state in context is ignored."""
+        boundaries = pmx.get_boundary_caps()
+        manager = pmx.boundary_manager
+        
+        adjusted = manager.adjust_boundaries(boundaries, context={"emotional_state": ["sad"]})
+        unadjusted = manager.adjust_boundaries(boundaries, context={})
+        assert adjusted == unadjusted
+        
+        sad = manager.adjust_boundaries(boundaries, context={"emotional_state": "sad"})
+        assert sad != unadjusted
+        
+        style = pmx.update_state_sync(StateUpdate(
+            event_type=EventType.SOCIAL,
+            intensity=0.5,
+            context={"emotional_state": ["sad"]},
+        ))
+        assert style is pmx.get_style_profile()
+    
     def test_invalid_import_data(self, pmx):
         """Test importing invalid personality data."""
         invalid_data = {
@@ -299,9 +358,94 @@ class TestPersonalityMatrix:
         traces = pmx.get_recent_traces(10)
         assert len(traces) >= len(updates)
     
+    @pytest.mark.asyncio
+    async def test_update_state_many(self, pmx, config):
+        """Test that batched updates reach the same state as consecutive updates."""
+        updates = [
+            StateUpdate(event_type=EventType.POSITIVE_INTERACTION, intensity=0.5),
+            StateUpdate(event_type=EventType.LEARNING, intensity=0.3),
+            StateUpdate(event_type=EventType.CREATIVITY, intensity=0.7),
+        ]
+        
+        sequential = PersonalityMatrix(config)
+        for update in updates:
+            await sequential.update_state(update)
+        
+        style = await pmx.update_state_many(updates)
+        
+        assert style is pmx.get_style_profile()
+        assert pmx.get_current_state().valence == sequential.get_current_state().valence
+        assert pmx.get_current_state().arousal == sequential.get_current_state().arousal
+        assert len(pmx.get_recent_traces(10)) == 1
+    
+    def test_update_state_sync(self, pmx):
+        """Test updating state outside an event loop."""
+        initial_state = pmx.get_current_state()
+        
+        update = StateUpdate(event_type=EventType.POSITIVE_INTERACTION, intensity=0.8)
+        new_style = pmx.update_state_sync(update)
+        
+        assert new_style is pmx.get_style_profile()
+        assert pmx.get_current_state().valence > initial_state.valence
+        assert len(pmx.get_recent_traces(10)) == 1
+    
+    @pytest.mark.asyncio
+    async def test_apply_lensing_sync(self, pmx):
+        """Test that synchronous lensing matches the awaited version."""
+        state = pmx.get_current_state()
+        style = pmx.get_style_profile()
+        context = {"emotional_state": "sad"}
+        
+        lenses = pmx.memory_lenser.apply_lensing_sync(state, style, context)
+        
+        assert lenses
+        assert lenses == await pmx.memory_lenser.apply_lensing(state, style, context)
+    
+    @pytest.mark.asyncio
+    async def test_noop_update_keeps_style(self, pmx):
+        """Test that a tiny update moves the state but keeps the style untraced."""
+        # Let the state settle at its equilibrium
+        for _ in range(100):
+            await pmx.update_state(StateUpdate(event_type=EventType.LEARNING, intensity=0.0))
+        
+        state = pmx.get_current_state()
+        style = pmx.get_style_profile()
+        trace_count = len(pmx.get_recent_traces(1000))
+        history_count = len(pmx._style_history)
+        
+        update = StateUpdate(event_type=EventType.POSITIVE_INTERACTION, intensity=0.0002)
+        assert await pmx.update_state(update) is style
+        
+        new_state = pmx.get_current_state()
+        assert new_state.valence > state.valence
+        assert new_state.ts > state.ts
+        assert pmx.get_style_profile() is style
+        assert len(pmx.get_recent_traces(1000)) == trace_count
+        assert len(pmx._style_history) == history_count
+    
+    def test_small_updates_accumulate(self, pmx):
+        """Test that a run of sub-epsilon updates still moves the state."""
+        # Let the state settle at its equilibrium
+        for _ in range(100):
+            pmx.update_state_sync(StateUpdate(event_type=EventType.LEARNING, intensity=0.0))
+        settled_state = pmx.get_current_state()
+        
+        update = StateUpdate(event_type=EventType.POSITIVE_INTERACTION, intensity=0.0002)
+        for _ in range(1000):
+            pmx.update_state_sync(update)
+        
+        # Each step is below the no-op epsilon, but together they add up
+        assert pmx.get_current_state().valence > settled_state.valence + 1e-4
+    
     def test_config_override(self):
         """Test that configuration overrides work correctly."""
         custom_config = PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.85, balance=0.9, wit=0.7, candor=0.8, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
             state_decay_rate=0.8,
             valence_setpoint=0.7,
             arousal_setpoint=0.6,
@@ -0,0 +1,174 @@
+"""
+Tests for the ObservabilityManager.
+
+This module contains tests for trace storage, compression of aged traces,
+and the analytics built on top of them.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import numpy as np
+import orjson
+
+from sam.persona.observability import ObservabilityManager
+from sam.persona.trace_compression import (
+    STYLE_DIMENSIONS,
+    TraceChunk,
+    decode_floats,
+    encode_floats,
+)
+from sam.persona.models import (
+    AffectiveState,
+    BoundaryCaps,
+    EventType,
+    PersonalityConfig,
+    StyleTrace,
+    TraitKernel,
+)
+
+
+def make_trace(ts, style_delta):
+    """Create a minimal style trace at the given timestamp."""
+    return StyleTrace(
+        ts=ts,
+        inputs={"event_type": EventType.SOCIAL, "intensity": 0.5},
+        state=AffectiveState(valence=0.5, arousal=0.4, fatigue=0.0, decay=0.9),
+        style_delta=style_delta,
+        boundaries={},
+        decoding_delta={},
+    )
+
+
+class TestTraceCompression:
+    """Test cases for compressed trace storage."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
+        """Create a test configuration shared by the class."""
+        return PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.8, balance=0.6, wit=0.7, candor=0.7, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
+            full_trace_retention=10,
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def traces(cls):
+        """Create a day of traces, one every ten minutes, shared by the class."""
+        start = datetime.utcnow() - timedelta(hours=23, minutes=55)
+        traces = []
+        for i in range(144):
+            delta = {} if i % 5 == 0 else {
+                dimension: f"{(i % 9 - 4) / 100:+.2f}" for dimension in STYLE_DIMENSIONS
+            }
+            traces.append(make_trace(start + timedelta(minutes=10 * i), delta))
+        return traces
+
+    def test_float_roundtrip(self):
+        """Test that the XOR encoder round-trips values exactly."""
+        values = np.array([0.05, 0.05, -0.02, np.nan, 0.0, 1e-9, -3.5])
+        decoded = decode_floats(encode_floats(values), len(values))
+        assert np.array_equal(decoded, values, equal_nan=True)
+
+    def test_chunk_roundtrip(self, traces):
+        """Test that a chunk preserves timestamps and style deltas."""
+        chunk = TraceChunk.from_traces(traces[:6])
+        expected_ms = [
+            int((t.ts - datetime(1970, 1, 1)) / timedelta(milliseconds=1)) for t in traces[:6]
+        ]
+        assert chunk.timestamps_ms().tolist() == expected_ms
+        assert chunk.changed_mask().tolist() == [bool(t.style_delta) for t in traces[:6]]
+        assert chunk.decode_dimension("warmth")[1] == pytest.approx(-0.03)
+        assert np.isnan(chunk.decode_dimension("warmth")[0])
+
+    def test_compaction_preserves_summary(self, config, traces):
+        """Test that style evolution is unchanged after compaction."""
+        manager = ObservabilityManager(config)
+        for trace in traces:
+            manager._traces.append(trace)
+        expected = manager.get_style_evolution_summary(24)
+
+        manager._compact_traces()
+
+        assert manager._trace_chunks
+        assert len(manager._traces) >= config.full_trace_retention
+        summary = manager.get_style_evolution_summary(24)
+        assert summary["total_traces"] == expected["total_traces"]
+        assert summary["total_style_changes"] == expected["total_style_changes"]
+        for dimension, stats in expected["dimension_changes"].items():
+            for key, value in stats.items():
+                assert summary["dimension_changes"][dimension][key] == pytest.approx(value)
+
+    def test_export_after_compaction(self, config, traces):
+        """Test that exports and queries cover only the traces kept in full."""
+        manager = ObservabilityManager(config)
+        for trace in traces:
+            manager._traces.append(trace)
+
+        manager._compact_traces()
+
+        kept = list(manager._traces)
+        assert len(kept) < len(traces)
+        exported = orjson.loads(manager.export_traces())
+        assert [entry["id"] for entry in exported] == [str(trace.id) for trace in kept]
+
+        window = (traces[0].ts, traces[-1].ts)
+        assert manager.get_traces_by_time_range(*window) == kept
+        assert manager.get_traces_by_event_type(EventType.SOCIAL) == kept
+
+        counts = manager.get_observability_summary()["traces"]
+        assert counts["compressed_count"] == len(traces) - len(kept)
+        assert counts["total_count"] == len(traces)
+
+    def test_summary_isolated_from_callers(self, config, traces):
+        """Test that mutating a returned summary leaves the cached one intact."""
+        manager = ObservabilityManager(config)
+        for trace in traces:
+            manager._traces.append(trace)
+
+        summary = manager.get_observability_summary()
+        expected = orjson.loads(orjson.dumps(summary))
+        summary["traces"]["total_count"] = -1
+        summary["style_evolution"]["dimension_changes"].clear()
+        summary.clear()
+
+        assert orjson.loads(orjson.dumps(manager.get_observability_summary())) == expected
+
+
+class TestDriftAlerts:
+    """Test cases for drift alert tracking."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create an observability manager with a test configuration."""
+        config = PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.8, balance=0.6, wit=0.7, candor=0.7, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
+        )
+        return ObservabilityManager(config)
+
+    def test_drift_counters_match_alerts(self, manager):
+        """Test that health counters agree with the recorded alerts."""
+        for i in range(9):
+            delta = "+0.50" if i % 3 else "+0.30"
+            manager.record_trace(make_trace(datetime.utcnow(), {"warmth": delta}))
+
+        alerts = manager.get_drift_alerts(100)
+        assert len(alerts) == 9
+        assert manager.get_drift_alerts(2) == alerts[-2:]
+
+        high = sum(1 for alert in alerts if alert["severity"] == "high")
+        assert manager._drift_counts() == (9, high)
+
+        drift_health = manager.get_health_status()["components"]["drift_detection"]
+        assert drift_health["status"] == "critical"
@@ -0,0 +1,150 @@
+"""
+Tests for the StateEngine.
+
+This module contains tests for affective state updates, predictions,
+and stability scoring.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from sam.persona.state_engine import StateEngine, _derive_state_tags
+from sam.persona.models import (
+    AffectiveState,
+    AudienceContext,
+    AudienceType,
+    BoundaryCaps,
+    ChannelContext,
+    ChannelType,
+    EventType,
+    PersonalityConfig,
+    StateUpdate,
+    TraitKernel,
+)
+
+
+class TestStateEngine:
+    """Test cases for the StateEngine class."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def engine(cls):
+        """Create a state engine shared by the class; updates never modify it."""
+        config = PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.8, balance=0.6, wit=0.7, candor=0.7, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
+        )
+        return StateEngine(config)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def state(cls):
+        """Create a neutral affective state; updates return new states, so it is shared."""
+        return AffectiveState(valence=0.2, arousal=0.4, fatigue=0.0, decay=0.9)
+
+    def test_update_state_known_values(self, engine, state):
+        """Test a single update against hand-computed values."""
+        update = StateUpdate(
+            event_type=EventType.ACHIEVEMENT,
+            intensity=1.0,
+            timestamp=datetime(2024, 1, 1, 12),
+        )
+
+        new_state = engine.update_state(state, update)
+
+        # decay -> event impact -> recovery toward setpoints
+        assert new_state.valence == pytest.approx((0.18 + 0.5) + (0.5 - 0.68) * 0.1, abs=1e-6)
+        assert new_state.arousal == pytest.approx((0.36 + 0.4) + (0.4 - 0.76) * 0.15, abs=1e-6)
+        assert new_state.fatigue == 0.0
+        assert new_state.tags == ["positive", "excited", "energetic", "enthusiastic"]
+        assert new_state.decay == state.decay
+
+    def test_update_state_stays_in_range(self, engine):
+        """Test that extreme events never produce out-of-range states."""
+        state = AffectiveState(valence=-0.9, arousal=0.05, fatigue=0.02, decay=1.0)
+        update = StateUpdate(
+            event_type=EventType.RELAXATION,
+            intensity=1.0,
+            audience=AudienceContext(type=AudienceType.CHILD),
+            timestamp=datetime(2024, 1, 1, 23),
+        )
+
+        for _ in range(5):
+            state = engine.update_state(state, update)
+            assert -1.0 <= state.valence <= 1.0
+            assert 0.0 <= state.arousal <= 1.0
+            assert 0.0 <= state.fatigue <= 1.0
+
+    def test_state_tags_match_rules(self, engine):
+        """Test that table lookups agree with the tag rules, including at thresholds."""
+        valences = [-1.0, -0.61, -0.6, -0.55, -0.5, -0.49, 0.0, 0.5, 0.51, 0.6, 0.61, 1.0]
+        levels = [0.0, 0.29, 0.3, 0.35, 0.4, 0.41, 0.6, 0.61, 0.7, 0.71, 1.0]
+
+        for valence in valences:
+            for arousal in levels:
+                for fatigue in levels:
+                    assert list(engine._update_state_tags(valence, arousal, fatigue)) == (
+                        _derive_state_tags(valence, arousal, fatigue)
+                    )
+
+    def test_predict_state_evolution(self, engine, state):
+        """Test that predictions recover toward the setpoints."""
+        predictions = engine.predict_state_evolution(state, timedelta(hours=2))
+
+        assert len(predictions) == 10
+        assert predictions[0].ts < predictions[-1].ts
+        assert all(p.tags == state.tags for p in predictions)
+        assert abs(predictions[-1].fatigue) < 1e-6
+
+    def test_update_state_batch_matches_scalar(self, engine):
+        """Test that batched updates match one-at-a-time updates."""
+        states = [
+            AffectiveState(valence=0.8, arousal=0.9, fatigue=0.8, decay=0.95),
+            AffectiveState(valence=-0.7, arousal=0.1, fatigue=0.3, decay=0.9),
+            AffectiveState(valence=0.0, arousal=0.5, fatigue=0.0, decay=1.0),
+        ]
+        updates = [
+            StateUpdate(event_type=EventType.STRESS, intensity=0.9, timestamp=datetime(2024, 1, 1, 23)),
+            StateUpdate(
+                event_type=EventType.SOCIAL,
+                intensity=0.4,
+                audience=AudienceContext(type=AudienceType.FRIEND),
+                channel=ChannelContext(type=ChannelType.VOICE),
+                timestamp=datetime(2024, 1, 1, 14),
+            ),
+            StateUpdate(event_type=EventType.FAILURE, intensity=1.0, timestamp=datetime(2024, 1, 1, 9)),
+        ]
+
+        result = engine.update_state_batch(
+            np.array([[s.valence, s.arousal, s.fatigue] for s in states]),
+            np.array([s.decay for s in states]),
+            *engine.encode_updates(updates),
+        )
+
+        for row, state, update in zip(result, states, updates):
+            expected = engine.update_state(state, update)
+            assert row.tolist() == pytest.approx(
+                [expected.valence, expected.arousal, expected.fatigue], abs=1e-6
+            )
+
+    def test_stability_score_batch_matches_scalar(self, engine):
+        """Test that batched stability scores match per-state scores."""
+        states = [
+            AffectiveState(valence=0.5, arousal=0.4, fatigue=0.0, decay=0.9),
+            AffectiveState(valence=-1.0, arousal=1.0, fatigue=1.0, decay=0.9),
+            AffectiveState(valence=0.1, arousal=0.7, fatigue=0.3, decay=0.9),
+        ]
+
+        scores = engine.get_state_stability_score_batch(
+            np.array([[s.valence, s.arousal, s.fatigue] for s in states])
+        )
+
+        assert scores.tolist() == pytest.approx(
+            [engine.get_state_stability_score(s) for s in states], abs=1e-6
+        )
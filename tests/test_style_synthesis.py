@@ -0,0 +1,250 @@
+"""
+Tests for the StyleSynthesizer.
+
+This module contains tests for style profile synthesis from traits,
+state, audience and channel context.
+"""
+
+import pytest
+
+import numpy as np
+
+from sam.persona.style_batch import SENTENCE_LENGTHS, StyleProfileBatch
+from sam.persona.style_synthesis import StyleSynthesizer, _sentence_length_codes
+from sam.persona.models import (
+    AffectiveState,
+    AudienceContext,
+    AudienceType,
+    BoundaryCaps,
+    ChannelContext,
+    ChannelType,
+    PersonalityConfig,
+    TraitKernel,
+)
+
+
+class TestStyleSynthesizer:
+    """Test cases for the StyleSynthesizer class."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
+        """Create a test configuration."""
+        return PersonalityConfig(
+            default_traits=TraitKernel(
+                curiosity=0.8, balance=0.6, wit=0.7, candor=0.7, care=0.8
+            ),
+            default_boundaries=BoundaryCaps(
+                max_flirtation=0.5, max_humor=0.8, max_candor=0.9, min_formality=0.2
+            ),
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def synthesizer(cls, config):
+        """Create a style synthesizer shared by the class; synthesis never modifies it."""
+        return StyleSynthesizer(config)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def state(cls):
+        """Create a calm, rested affective state shared by the class."""
+        return AffectiveState(valence=0.2, arousal=0.4, fatigue=0.0, decay=0.9)
+
+    def test_synthesize_style_known_values(self, synthesizer, config, state):
+        """Test blended levels against hand-computed values."""
+        style = synthesizer.synthesize_style(config.default_traits, state)
+
+        assert style.tone.warmth == pytest.approx(0.484)
+        assert style.tone.formality == pytest.approx(0.384)
+        assert style.tone.humor == pytest.approx(0.468)
+        assert style.tone.flirtation == pytest.approx(0.376)
+        assert style.pacing.expansiveness == pytest.approx(0.5)
+        assert style.stance.assertiveness == pytest.approx(0.422)
+
+    def test_audience_modifiers(self, synthesizer, config, state):
+        """Test that audience modifiers scale the blended levels."""
+        style = synthesizer.synthesize_style(
+            config.default_traits, state, audience=AudienceContext(type=AudienceType.FRIEND)
+        )
+
+        assert style.tone.warmth == pytest.approx(0.484 * 1.3)
+        assert style.tone.formality == pytest.approx(0.384 * 0.6)
+        assert style.tone.flirtation == pytest.approx(0.376 * 1.1)
+        assert style.pacing.expansiveness == pytest.approx(0.5)
+        assert style.stance.assertiveness == pytest.approx(0.422 * 1.1)
+
+    def test_sentence_length_codes_match_rules(self, synthesizer):
+        """Test that branchless sentence lengths agree with the rules, including at thresholds."""
+        levels = [0.0, 0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 1.0]
+        rows = [
+            (curiosity, candor, arousal, fatigue)
+            for curiosity in levels
+            for candor in levels
+            for arousal in levels
+            for fatigue in levels
+        ]
+        traits = np.array([[curiosity, 0.5, 0.5, candor, 0.5] for curiosity, candor, _, _ in rows])
+        states = np.array([[0.0, arousal, fatigue] for _, _, arousal, fatigue in rows])
+
+        codes = _sentence_length_codes(traits, states)
+
+        for code, (curiosity, candor, arousal, fatigue) in zip(codes, rows):
+            diction = synthesizer._synthesize_diction(
+                TraitKernel(curiosity=curiosity, balance=0.5, wit=0.5, candor=candor, care=0.5),
+                AffectiveState(valence=0.0, arousal=arousal, fatigue=fatigue, decay=0.9),
+            )
+            assert SENTENCE_LENGTHS[code] == diction.sentence_len
+
+    def test_synthesize_style_batch_matches_scalar(self, synthesizer, config, state):
+        """Test that batched levels match one-at-a-time synthesis."""
+        traits = [
+            config.default_traits,
+            TraitKernel(curiosity=0.1, balance=0.9, wit=0.2, candor=0.95, care=0.3),
+            TraitKernel(curiosity=1.0, balance=0.0, wit=1.0, candor=0.0, care=1.0),
+        ]
+        states = [
+            state,
+            AffectiveState(valence=-0.8, arousal=0.9, fatigue=0.7, decay=0.9),
+            AffectiveState(valence=1.0, arousal=0.0, fatigue=1.0, decay=0.9),
+        ]
+        audiences = [None, AudienceContext(type=AudienceType.CHILD), AudienceContext(type=AudienceType.INTIMATE)]
+        channels = [ChannelContext(type=ChannelType.EMAIL), None, ChannelContext(type=ChannelType.VOICE)]
+
+        levels = synthesizer.synthesize_style_batch(
+            np.array([[t.curiosity, t.balance, t.wit, t.candor, t.care] for t in traits]),
+            np.array([[s.valence, s.arousal, s.fatigue] for s in states]),
+            *synthesizer.encode_contexts(audiences, channels),
+        )
+
+        for row, t, s, audience, channel in zip(levels, traits, states, audiences, channels):
+            style = synthesizer.synthesize_style(t, s, audience, channel)
+            assert row.tolist() == pytest.approx([
+                style.tone.warmth,
+                style.tone.formality,
+                style.tone.humor,
+                style.tone.flirtation,
+                style.pacing.expansiveness,
+                style.stance.assertiveness,
+            ])
+
+    def test_synthesize_profile_batch_matches_scalar(self, synthesizer, config):
+        """Test that fused batch synthesis matches complete per-profile synthesis."""
+        traits = [
+            config.default_traits,
+            TraitKernel(curiosity=0.1, balance=0.9, wit=0.2, candor=0.95, care=0.3),
+            TraitKernel(curiosity=0.9, balance=0.4, wit=0.6, candor=0.5, care=0.7),
+        ]
+        states = [
+            AffectiveState(valence=0.6, arousal=0.8, fatigue=0.1, decay=0.9),
+            AffectiveState(valence=-0.8, arousal=0.9, fatigue=0.7, decay=0.9),
+            AffectiveState(valence=0.3, arousal=0.6, fatigue=0.2, decay=0.9),
+        ]
+        audiences = [None, AudienceContext(type=AudienceType.CHILD), AudienceContext(type=AudienceType.INTIMATE)]
+        channels = [None, ChannelContext(type=ChannelType.VIDEO), None]
+        boundaries = config.default_boundaries
+
+        batch = synthesizer.synthesize_profile_batch(
+            np.array([[t.curiosity, t.balance, t.wit, t.candor, t.care] for t in traits]),
+            np.array([[s.valence, s.arousal, s.fatigue] for s in states]),
+            *synthesizer.encode_contexts(audiences, channels),
+            boundaries=boundaries,
+        )
+
+        assert len(batch) == 3
+        for i, (t, s, audience, channel) in enumerate(zip(traits, states, audiences, channels)):
+            profile = batch.to_profile(i)
+            style = synthesizer.synthesize_style(t, s, audience, channel, boundaries)
+            for section in ("tone", "diction", "pacing", "stance", "boundaries"):
+                assert getattr(profile, section).model_dump() == pytest.approx(
+                    getattr(style, section).model_dump()
+                )
+            decoding = profile.decoding.model_dump()
+            expected = style.decoding.model_dump()
+            assert decoding.pop("max_tokens") == pytest.approx(expected.pop("max_tokens"), abs=1)
+            assert decoding == pytest.approx(expected)
+
+    def test_compatibility_matrix_matches_scalar(self, synthesizer, config):
+        """Test that pairwise compatibility matches per-pair scores."""
+        styles = [
+            synthesizer.synthesize_style(
+                config.default_traits,
+                AffectiveState(valence=valence, arousal=arousal, fatigue=fatigue, decay=0.9),
+                audience=AudienceContext(type=audience_type),
+            )
+            for valence, arousal, fatigue, audience_type in [
+                (0.2, 0.4, 0.0, AudienceType.FRIEND),
+                (-0.9, 1.0, 0.8, AudienceType.PROFESSIONAL),
+                (0.7, 0.1, 0.3, AudienceType.CHILD),
+            ]
+        ]
+        features = np.array([
+            [
+                style.tone.warmth,
+                style.tone.formality,
+                style.tone.humor,
+                style.stance.assertiveness,
+                style.pacing.expansiveness,
+            ]
+            for style in styles
+        ])
+
+        matrix = StyleSynthesizer.compatibility_matrix(features, features[:2])
+
+        assert matrix.shape == (3, 2)
+        for i, style1 in enumerate(styles):
+            for j, style2 in enumerate(styles[:2]):
+                assert matrix[i, j] == pytest.approx(
+                    synthesizer.get_style_compatibility_score(style1, style2)
+                )
+
+    def test_profile_batch_roundtrip(self, synthesizer, config, state):
+        """Test that single-precision batches round-trip and match per-profile decoding."""
+        styles = [
+            synthesizer.synthesize_style(config.default_traits, state),
+            synthesizer.synthesize_style(
+                config.default_traits,
+                AffectiveState(valence=0.9, arousal=0.9, fatigue=0.1, decay=0.9),
+                audience=AudienceContext(type=AudienceType.INTIMATE),
+                channel=ChannelContext(type=ChannelType.EMAIL),
+            ),
+        ]
+
+        batch = StyleProfileBatch.from_profiles(styles)
+        for i, style in enumerate(styles):
+            profile = batch.to_profile(i)
+            for section in ("tone", "diction", "pacing", "stance", "boundaries", "decoding"):
+                assert getattr(profile, section).model_dump() == pytest.approx(
+                    getattr(style, section).model_dump()
+                )
+
+        batch.temp.fill(0.0)
+        batch.max_tokens.fill(0)
+        synthesizer.synthesize_decoding_batch(batch)
+        for i, style in enumerate(styles):
+            decoding = batch.to_profile(i).decoding.model_dump()
+            expected = style.decoding.model_dump()
+            # Token counts truncate, so single precision may shift them by one
+            assert decoding.pop("max_tokens") == pytest.approx(expected.pop("max_tokens"), abs=1)
+            assert decoding == pytest.approx(expected)
+
+        batch.apply_boundaries(config.default_boundaries)
+        assert batch.flirtation.max() <= config.default_boundaries.max_flirtation
+        assert batch.formality.min() >= config.default_boundaries.min_formality
+
+    def test_style_cache(self, config, state):
+        """Test that cached synthesis stays close to exact synthesis and returns fresh profiles."""
+        cached = StyleSynthesizer(config.model_copy(update={"enable_style_cache": True}))
+        exact = StyleSynthesizer(config)
+        audience = AudienceContext(type=AudienceType.COLLEAGUE)
+
+        first = cached.synthesize_style(config.default_traits, state, audience, None, config.default_boundaries)
+        first.tone.warmth = 0.0
+        second = cached.synthesize_style(config.default_traits, state, audience, None, config.default_boundaries)
+        expected = exact.synthesize_style(config.default_traits, state, audience, None, config.default_boundaries)
+
+        assert cached._style_cache.cache_info().hits == 1
+        assert second.tone.warmth != 0.0
+        assert second.tone.warmth == pytest.approx(expected.tone.warmth, abs=0.05)
+        assert second.tone.flirtation <= config.default_boundaries.max_flirtation
+        assert second.diction.sentence_len == expected.diction.sentence_len